@@ -0,0 +1,55 @@
+"""Create contatos table
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "contatos",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("nome", sa.String(), nullable=False),
+        sa.Column("telefone", sa.String(), nullable=False),
+        sa.Column("email", sa.String(), nullable=True),
+        sa.Column("motivo", sa.String(), nullable=False),
+        sa.Column(
+            "data_cadastro",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("(CURRENT_TIMESTAMP)"),
+            nullable=True,
+        ),
+        sa.Column("status_mcp", sa.String(), nullable=True),
+        sa.Column("extra_data", sa.JSON(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("(CURRENT_TIMESTAMP)"),
+            nullable=True,
+        ),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_contatos_id", "contatos", ["id"])
+    op.create_index("ix_contatos_nome", "contatos", ["nome"])
+    op.create_index("ix_contatos_telefone", "contatos", ["telefone"])
+    op.create_index("ix_contatos_email", "contatos", ["email"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_contatos_email", table_name="contatos")
+    op.drop_index("ix_contatos_telefone", table_name="contatos")
+    op.drop_index("ix_contatos_nome", table_name="contatos")
+    op.drop_index("ix_contatos_id", table_name="contatos")
+    op.drop_table("contatos")
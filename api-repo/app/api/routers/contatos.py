@@ -1,12 +1,13 @@
 """Contact CRUD endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
 from app.core.database import get_db
+from app.core.etag import etag_matches
 from app.schemas.contato import ContatoCreate, ContatoUpdate, ContatoOut
-from app.services.crud_service import ContatoService
+from app.services.crud_service import ContatoService, PreconditionFailedError
 
 router = APIRouter(prefix="/contatos", tags=["contatos"])
 
@@ -72,39 +73,82 @@ Lista todos os contatos com paginação e filtros opcionais.
 - `/contatos?skip=0&limit=20` - Primeira página
 - `/contatos?motivo=apoio+emocional` - Filtrar por motivo
 - `/contatos?status_mcp=sincronizado` - Contatos já sincronizados
+
+**Cache:** a resposta inclui um `ETag`; envie-o em `If-None-Match` para
+receber `304 Not Modified` enquanto a listagem não mudar.
     """,
 )
 async def list_contatos(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     motivo: Optional[str] = None,
     status_mcp: Optional[str] = None,
+    if_none_match: Optional[str] = Header(None),
     db: Session = Depends(get_db),
 ):
     """List all contacts with pagination and filters."""
     service = ContatoService()
-    return service.list_contatos(db, skip, limit, motivo, status_mcp)
+    contatos, etag = service.list_contatos_with_etag(
+        db, skip, limit, motivo, status_mcp
+    )
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    response.headers["ETag"] = etag
+    return service.to_out(contatos)
 
 
 @router.get("/{id}", response_model=ContatoOut)
-async def get_contato(id: int, db: Session = Depends(get_db)):
+async def get_contato(
+    id: int,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+):
     """Get a specific contact by ID."""
     service = ContatoService()
-    contato = service.get_contato(db, id)
-    if not contato:
+    if if_none_match:
+        # Cheap (id, version) projection so a 304 never loads the full row
+        etag = service.contato_etag(db, id)
+        if etag and etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers={"ETag": etag})
+
+    result = service.get_contato_with_etag(db, id)
+    if not result:
         raise HTTPException(status_code=404, detail="Contact not found")
+    contato, etag = result
+    response.headers["ETag"] = etag
     return contato
 
 
-@router.put("/{id}", response_model=ContatoOut)
-async def update_contato(id: int, data: ContatoUpdate, db: Session = Depends(get_db)):
-    """Update an existing contact."""
+@router.put(
+    "/{id}",
+    response_model=ContatoOut,
+    responses={
+        404: {"description": "Contato não encontrado"},
+        412: {"description": "If-Match não corresponde à versão atual"},
+        422: {"description": "Validação falhou"},
+    },
+)
+async def update_contato(
+    id: int,
+    data: ContatoUpdate,
+    response: Response,
+    if_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+):
+    """Update an existing contact (optimistic concurrency via If-Match)."""
     service = ContatoService()
     try:
-        contato = service.update_contato(db, id, data)
-        if not contato:
+        result = service.update_contato_with_etag(db, id, data, if_match)
+        if not result:
             raise HTTPException(status_code=404, detail="Contact not found")
+        contato, etag = result
+        response.headers["ETag"] = etag
         return contato
+    except PreconditionFailedError as e:
+        raise HTTPException(status_code=412, detail=str(e))
     except ValueError as e:
         raise HTTPException(status_code=422, detail=str(e))
 
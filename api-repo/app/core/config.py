@@ -1,6 +1,6 @@
 """Application settings and configuration."""
 
-from typing import List
+from typing import List, Optional
 from pydantic_settings import BaseSettings
 
 
@@ -15,10 +15,16 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str = "sqlite:///./database.db"
+    # Create missing tables at startup instead of running Alembic (local only)
+    AUTO_CREATE_SCHEMA: bool = False
+    # Statements slower than this are logged with their EXPLAIN plan
+    SLOW_QUERY_MS: int = 100
 
     # LLM Service (MCP)
     LLM_URL: str = "http://localhost:11434"
     LLM_TIMEOUT: int = 30
+    # Completion cap for extraction (the JSON answer is ~80 tokens)
+    LLM_NUM_PREDICT: int = 256
 
     # Security
     SECRET_KEY: str = "change-me-in-production"
@@ -33,6 +39,14 @@ class Settings(BaseSettings):
     LOG_LEVEL: str = "INFO"
     LOG_FORMAT: str = "json"
 
+    # Profiling (X-Profile header with PROFILE_TOKEN forces a capture;
+    # requests slower than PROFILE_SLOW_THRESHOLD_MS are captured, 0 = off)
+    PROFILE_TOKEN: Optional[str] = None
+    PROFILE_SLOW_THRESHOLD_MS: int = 2000
+    PROFILE_SAMPLE_INTERVAL_MS: int = 5
+    PROFILE_DIR: str = "profiles"
+    PROFILE_MAX_CAPTURES: int = 50
+
     # Export
     EXPORT_MAX_RECORDS: int = 10000
 
@@ -5,6 +5,7 @@ from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
 from app.core.config import settings
+from app.core.query_stats import install_query_hooks
 
 # Create engine
 engine = create_engine(
@@ -14,6 +15,9 @@ engine = create_engine(
     ),
 )
 
+# Per-request statement counts and slow-query log
+install_query_hooks()
+
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -0,0 +1,34 @@
+"""HTTP entity tags for conditional requests."""
+
+import hashlib
+from typing import Any, Optional
+
+
+def make_etag(*parts: Any) -> str:
+    """Build a strong, quoted ETag from the given version parts."""
+    raw = "|".join("" if part is None else str(part) for part in parts)
+    return f'"{hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()}"'
+
+
+def etag_matches(header: Optional[str], etag: str, weak: bool = True) -> bool:
+    """Check an If-None-Match / If-Match header value against an ETag.
+
+    ``weak=True`` applies the weak comparison used by If-None-Match (a ``W/``
+    prefix is ignored); ``weak=False`` applies the strong comparison required
+    by If-Match.
+    """
+    if not header:
+        return False
+
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            if not weak:
+                continue
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+
+    return False
@@ -0,0 +1,148 @@
+"""Prometheus metrics and the HTTP instrumentation middleware."""
+
+import time
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, Callable, Iterator, TypeVar
+
+from prometheus_client import CONTENT_TYPE_LATEST, Counter, Gauge, Histogram
+from prometheus_client import generate_latest
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Latency buckets sized around the p95 targets (API < 500 ms, LLM < 3-5 s)
+HTTP_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+DB_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1)
+LLM_BUCKETS = (0.1, 0.25, 0.5, 1, 2, 3, 5, 8, 13, 20, 30, 60)
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ["method", "route", "status"],
+    buckets=HTTP_BUCKETS,
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "HTTP requests currently being served",
+    ["method"],
+)
+DB_QUERY_DURATION = Histogram(
+    "db_query_duration_seconds",
+    "ContatoRepository operation latency",
+    ["operation"],
+    buckets=DB_BUCKETS,
+)
+LLM_CALL_DURATION = Histogram(
+    "llm_call_duration_seconds",
+    "LLM call latency by outcome",
+    ["operation", "outcome"],
+    buckets=LLM_BUCKETS,
+)
+LLM_CALLS = Counter(
+    "llm_calls_total",
+    "LLM calls by outcome",
+    ["operation", "outcome"],
+)
+
+
+def route_template(scope: Scope) -> str:
+    """Resolve the route template of a request (bounded label cardinality).
+
+    Uses the route the router recorded in the scope when available, falling
+    back to matching the application's routes.
+    """
+    route = scope.get("route")
+    template = getattr(route, "path", None)
+    if template:
+        # Newer FastAPI versions record the route relative to its router's
+        # prefix; restore the prefix from the leading segments of the path.
+        segments = scope["path"].rstrip("/").split("/")
+        depth = len(template.rstrip("/").split("/")) - 1
+        prefix = "/".join(segments[: len(segments) - depth])
+        if prefix and not template.startswith(prefix + "/"):
+            return prefix + template
+        return template
+
+    app = scope.get("app")
+    for route in getattr(app, "routes", []):
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return getattr(route, "path", UNMATCHED_ROUTE)
+    return UNMATCHED_ROUTE
+
+
+class PrometheusMiddleware:
+    """ASGI middleware recording per-route latency and in-flight requests."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = "500"
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = str(message["status"])
+            await send(message)
+
+        in_progress = HTTP_REQUESTS_IN_PROGRESS.labels(method)
+        in_progress.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # Resolved after the call: routing has filled in the scope by now
+            route = route_template(scope)
+            HTTP_REQUEST_DURATION.labels(method, route, status).observe(
+                time.perf_counter() - start
+            )
+            in_progress.dec()
+
+
+def timed_db(operation: str) -> Callable[[F], F]:
+    """Decorate a repository function to record its duration."""
+
+    def decorator(func: F) -> F:
+        histogram = DB_QUERY_DURATION.labels(operation)
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                histogram.observe(time.perf_counter() - start)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+@contextmanager
+def observe_llm_call(operation: str) -> Iterator[None]:
+    """Record duration and outcome (success/error) of an LLM call."""
+    start = time.perf_counter()
+    outcome = "error"
+    try:
+        yield
+        outcome = "success"
+    finally:
+        LLM_CALL_DURATION.labels(operation, outcome).observe(
+            time.perf_counter() - start
+        )
+        LLM_CALLS.labels(operation, outcome).inc()
+
+
+def render_metrics() -> tuple:
+    """Render the default registry as (body, content type)."""
+    return generate_latest(), CONTENT_TYPE_LATEST
@@ -0,0 +1,206 @@
+"""On-demand and slow-request statistical profiling.
+
+A single daemon thread samples the Python stack of the thread serving each
+tracked request (the event loop thread for ``async`` endpoints) and folds the
+samples into collapsed-stack lines (``frame;frame;frame count``), the input
+format of flamegraph.pl / speedscope.
+
+A request is sampled from its first millisecond when it carries the
+``X-Profile`` header with the configured token. Otherwise sampling only
+starts once the request has been running for the slow threshold, so fast
+requests cost one dict insert/delete and slow ones capture the part of the
+request that made them slow. Since the event loop is shared, samples of a
+slow request also include concurrent requests running on the same loop.
+"""
+
+import os
+import re
+import secrets
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Dict, List, Optional
+
+import structlog
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.config import settings
+
+logger = structlog.get_logger()
+
+PROFILE_HEADER = b"x-profile"
+PROFILES_PATH = "/debug/profiles"
+CAPTURE_SUFFIX = ".collapsed"
+_CAPTURE_NAME = re.compile(r"^[\w.-]+\.collapsed$")
+
+
+def is_authorized(token: Optional[str]) -> bool:
+    """Check a debug token against PROFILE_TOKEN (profiling is off if unset)."""
+    if not settings.PROFILE_TOKEN or not token:
+        return False
+    return secrets.compare_digest(token, settings.PROFILE_TOKEN)
+
+
+class CaptureStore:
+    """Bounded directory of collapsed-stack captures (oldest evicted first)."""
+
+    def __init__(self, directory: str, max_captures: int):
+        self.directory = directory
+        self.max_captures = max_captures
+
+    def save(self, label: str, lines: List[str]) -> str:
+        """Write a capture and evict the oldest ones beyond the limit."""
+        os.makedirs(self.directory, exist_ok=True)
+        slug = re.sub(r"[^\w-]+", "_", label).strip("_")[:80] or "request"
+        name = f"{time.strftime('%Y%m%dT%H%M%S')}-{time.time_ns() % 10**9:09d}-{slug}"
+        path = os.path.join(self.directory, name + CAPTURE_SUFFIX)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+
+        for old in self.list()[self.max_captures :]:
+            try:
+                os.remove(os.path.join(self.directory, old["name"]))
+            except FileNotFoundError:
+                pass
+        return name + CAPTURE_SUFFIX
+
+    def list(self) -> List[Dict]:
+        """List captures, newest first."""
+        if not os.path.isdir(self.directory):
+            return []
+        captures = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and _CAPTURE_NAME.match(entry.name):
+                stat = entry.stat()
+                captures.append(
+                    {"name": entry.name, "size": stat.st_size, "mtime": stat.st_mtime}
+                )
+        return sorted(captures, key=lambda c: (c["mtime"], c["name"]), reverse=True)
+
+    def read(self, name: str) -> Optional[str]:
+        """Read a capture by name (None if missing or not a capture name)."""
+        if not _CAPTURE_NAME.match(name):
+            return None
+        path = os.path.join(self.directory, name)
+        if not os.path.isfile(path):
+            return None
+        with open(path, encoding="utf-8") as f:
+            return f.read()
+
+
+class _Tracked:
+    __slots__ = ("thread_id", "start", "forced", "samples")
+
+    def __init__(self, thread_id: int, forced: bool):
+        self.thread_id = thread_id
+        self.start = time.perf_counter()
+        self.forced = forced
+        self.samples: Counter = Counter()
+
+
+class StackSampler:
+    """Background thread sampling the stacks of tracked requests."""
+
+    def __init__(self, interval: float, slow_threshold: float):
+        self.interval = interval
+        self.slow_threshold = slow_threshold
+        self._tracked: Dict[int, _Tracked] = {}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self, forced: bool) -> _Tracked:
+        """Start tracking the calling thread's current request."""
+        tracked = _Tracked(threading.get_ident(), forced)
+        with self._lock:
+            self._tracked[id(tracked)] = tracked
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="stack-sampler", daemon=True
+                )
+                self._thread.start()
+        return tracked
+
+    def stop(self, tracked: _Tracked) -> None:
+        """Stop tracking a request."""
+        with self._lock:
+            self._tracked.pop(id(tracked), None)
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(self.interval)
+            now = time.perf_counter()
+            with self._lock:
+                due = [
+                    t
+                    for t in self._tracked.values()
+                    if t.forced or now - t.start >= self.slow_threshold
+                ]
+            if not due:
+                continue
+            frames = sys._current_frames()  # noqa: SLF001
+            for tracked in due:
+                frame = frames.get(tracked.thread_id)
+                if frame is not None:
+                    tracked.samples[collapse(frame)] += 1
+
+
+def collapse(frame) -> str:  # type: ignore[no-untyped-def]
+    """Fold a frame's stack into a ``root;...;leaf`` line."""
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        names.append(
+            f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})"
+        )
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+class ProfilingMiddleware:
+    """ASGI middleware capturing profiles of flagged or slow requests."""
+
+    def __init__(self, app: ASGIApp, store: Optional[CaptureStore] = None):
+        self.app = app
+        self.store = store or CaptureStore(
+            settings.PROFILE_DIR, settings.PROFILE_MAX_CAPTURES
+        )
+        self.slow_threshold = settings.PROFILE_SLOW_THRESHOLD_MS / 1000
+        self.sampler = StackSampler(
+            settings.PROFILE_SAMPLE_INTERVAL_MS / 1000, self.slow_threshold
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"].startswith(PROFILES_PATH):
+            await self.app(scope, receive, send)
+            return
+
+        token = dict(scope["headers"]).get(PROFILE_HEADER, b"").decode("latin-1")
+        forced = is_authorized(token)
+        if not forced and self.slow_threshold <= 0:
+            await self.app(scope, receive, send)
+            return
+
+        tracked = self.sampler.start(forced)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.sampler.stop(tracked)
+            elapsed = time.perf_counter() - tracked.start
+            if tracked.samples and (forced or elapsed >= self.slow_threshold):
+                self._save(scope, tracked, elapsed)
+
+    def _save(self, scope: Scope, tracked: _Tracked, elapsed: float) -> None:
+        lines = [f"{stack} {count}" for stack, count in tracked.samples.items()]
+        try:
+            name = self.store.save(f"{scope['method']}-{scope['path']}", lines)
+        except OSError as e:
+            logger.warning("profile_capture_failed", error=str(e))
+            return
+        logger.info(
+            "profile_captured",
+            capture=name,
+            path=scope["path"],
+            elapsed_ms=round(elapsed * 1000, 1),
+            forced=tracked.forced,
+        )
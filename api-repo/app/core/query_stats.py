@@ -0,0 +1,136 @@
+"""Per-request SQL statement counting, slow-query log and EXPLAIN capture."""
+
+import time
+from contextvars import ContextVar
+from typing import Any, List, Optional
+
+import structlog
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+logger = structlog.get_logger()
+
+_EXPLAIN_PREFIX = {"sqlite": "EXPLAIN QUERY PLAN ", "postgresql": "EXPLAIN "}
+
+
+class QueryStats:
+    """Statement count and cumulative time of one request."""
+
+    __slots__ = ("count", "total_time")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_time = 0.0
+
+
+_current: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def current_stats() -> Optional[QueryStats]:
+    """Get the stats of the request being served, if any."""
+    return _current.get()
+
+
+def _before_cursor_execute(
+    conn: Any,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    context._query_start = time.perf_counter()  # noqa: SLF001
+
+
+def _after_cursor_execute(
+    conn: Any,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    elapsed = time.perf_counter() - context._query_start  # noqa: SLF001
+
+    stats = _current.get()
+    if stats is not None:
+        stats.count += 1
+        stats.total_time += elapsed
+
+    if elapsed * 1000 >= settings.SLOW_QUERY_MS:
+        plan = None
+        if not executemany:
+            plan = explain(conn.dialect.name, cursor, statement, parameters)
+        logger.warning(
+            "slow_query",
+            duration_ms=round(elapsed * 1000, 2),
+            statement=statement,
+            plan=plan,
+        )
+
+
+def explain(
+    dialect: str, cursor: Any, statement: str, parameters: Any
+) -> Optional[List[str]]:
+    """Run EXPLAIN for a SELECT on the same DBAPI connection.
+
+    Only SELECTs are explained, so a plan is never obtained by re-running a
+    write. Returns None when the dialect or statement is not supported.
+    """
+    prefix = _EXPLAIN_PREFIX.get(dialect)
+    if not prefix or not statement.lstrip().upper().startswith("SELECT"):
+        return None
+    try:
+        explain_cursor = cursor.connection.cursor()
+        try:
+            explain_cursor.execute(prefix + statement, parameters)
+            return [" ".join(str(col) for col in row) for row in explain_cursor]
+        finally:
+            explain_cursor.close()
+    except Exception as e:  # the plan is best effort, never fail the query
+        logger.warning("explain_failed", error=str(e))
+        return None
+
+
+def install_query_hooks() -> None:
+    """Attach the statement hooks to every SQLAlchemy engine (idempotent)."""
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class QueryStatsMiddleware:
+    """ASGI middleware scoping QueryStats to a request.
+
+    In DEBUG mode the totals are returned as ``X-DB-Queries`` and
+    ``X-DB-Time`` (milliseconds) response headers.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = _current.set(stats)
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and settings.DEBUG:
+                headers = list(message.get("headers", []))
+                headers.append((b"x-db-queries", str(stats.count).encode()))
+                headers.append(
+                    (b"x-db-time", f"{stats.total_time * 1000:.2f}".encode())
+                )
+                message["headers"] = headers
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current.reset(token)
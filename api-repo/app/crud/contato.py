@@ -1,8 +1,11 @@
 """Contact CRUD operations."""
 
 from typing import Optional, List
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.exc import StaleDataError
 
+from app.core.metrics import timed_db
 from app.models.contato import Contato
 
 
@@ -10,6 +13,7 @@ class ContatoRepository:
     """Repository pattern for contact database operations."""
 
     @staticmethod
+    @timed_db("create")
     def create(db: Session, contato_data: dict) -> Contato:
         """Create a new contact."""
         db_contato = Contato(**contato_data)
@@ -19,16 +23,29 @@ class ContatoRepository:
         return db_contato
 
     @staticmethod
+    @timed_db("get")
     def get(db: Session, contato_id: int) -> Optional[Contato]:
         """Get contact by ID."""
         return db.query(Contato).filter(Contato.id == contato_id).first()
 
     @staticmethod
+    @timed_db("get_version")
+    def get_version(db: Session, contato_id: int) -> Optional[Row]:
+        """Get the (id, version) of a contact without loading the full row."""
+        return (
+            db.query(Contato.id, Contato.version)
+            .filter(Contato.id == contato_id)
+            .first()
+        )
+
+    @staticmethod
+    @timed_db("get_by_telefone")
     def get_by_telefone(db: Session, telefone: str) -> Optional[Contato]:
         """Get contact by phone number."""
         return db.query(Contato).filter(Contato.telefone == telefone).first()
 
     @staticmethod
+    @timed_db("list_all")
     def list_all(
         db: Session,
         skip: int = 0,
@@ -47,11 +64,27 @@ class ContatoRepository:
         return query.offset(skip).limit(limit).all()
 
     @staticmethod
-    def update(db: Session, contato_id: int, contato_data: dict) -> Optional[Contato]:
-        """Update an existing contact."""
+    @timed_db("update")
+    def update(
+        db: Session,
+        contato_id: int,
+        contato_data: dict,
+        expected_version: Optional[int] = None,
+    ) -> Optional[Contato]:
+        """Update an existing contact.
+
+        When ``expected_version`` is given the write is a compare-and-set: the
+        UPDATE is issued with ``WHERE version = :expected_version`` and
+        ``StaleDataError`` is raised if another transaction got there first.
+        """
         db_contato = db.query(Contato).filter(Contato.id == contato_id).first()
         if not db_contato:
             return None
+        if expected_version is not None and db_contato.version != expected_version:
+            raise StaleDataError(
+                f"Contato {contato_id} is at version {db_contato.version}, "
+                f"expected {expected_version}"
+            )
 
         for field, value in contato_data.items():
             if value is not None:
@@ -62,6 +95,7 @@ class ContatoRepository:
         return db_contato
 
     @staticmethod
+    @timed_db("delete")
     def delete(db: Session, contato_id: int) -> bool:
         """Delete a contact."""
         db_contato = db.query(Contato).filter(Contato.id == contato_id).first()
@@ -73,6 +107,7 @@ class ContatoRepository:
         return True
 
     @staticmethod
+    @timed_db("count")
     def count(db: Session) -> int:
         """Count total contacts."""
         return db.query(Contato).count()
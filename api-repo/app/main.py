@@ -1,17 +1,35 @@
 """FastAPI application main entry point."""
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.config import settings
 from app.core.database import Base, engine
+from app.core.metrics import PrometheusMiddleware
+from app.core.profiling import ProfilingMiddleware
+from app.core.query_stats import QueryStatsMiddleware
 from app.api.routers import contatos
 from app.api.routers.health import router as health_router
+from app.api.routers.metrics import router as metrics_router
+from app.api.routers.profiling import router as profiling_router
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup and shutdown.
+
+    The schema is managed by Alembic (``alembic upgrade head``); creating
+    tables here is an opt-in shortcut for throwaway local databases.
+    """
+    if settings.AUTO_CREATE_SCHEMA:
+        Base.metadata.create_all(bind=engine)
+    yield
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
 
 app = FastAPI(
+    lifespan=lifespan,
     title="Central de Acolhimento API",
     description="""
 ## 🏥 API para Central de Acolhimento
@@ -93,9 +111,14 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(QueryStatsMiddleware)
+app.add_middleware(ProfilingMiddleware)
+app.add_middleware(PrometheusMiddleware)
 
 # Include routers
 app.include_router(health_router)
+app.include_router(metrics_router)
+app.include_router(profiling_router)
 app.include_router(contatos.router, prefix="/api/v1")
 
 
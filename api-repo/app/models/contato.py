@@ -22,6 +22,10 @@ class Contato(Base):
     extra_data = Column(JSON, nullable=True)  # Extra data extracted by LLM
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    # Row version, bumped by SQLAlchemy on every UPDATE; backs ETags/If-Match
+    version = Column(Integer, nullable=False, server_default="1")
+
+    __mapper_args__ = {"version_id_col": version}
 
     def __repr__(self) -> str:
         """String representation."""
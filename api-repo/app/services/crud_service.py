@@ -1,12 +1,20 @@
 """Business logic for CRUD operations."""
 
-from typing import Optional, List
+from typing import Optional, List, Tuple, Union
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.exc import StaleDataError
 
 from app.schemas.contato import ContatoCreate, ContatoUpdate, ContatoOut
 from app.crud.contato import ContatoRepository
 from app.services.llm_integration import LLMIntegration
 from app.core.config import settings
+from app.core.etag import etag_matches, make_etag
+from app.models.contato import Contato
+
+
+class PreconditionFailedError(Exception):
+    """Raised when an If-Match precondition does not hold."""
 
 
 class ContatoService:
@@ -64,6 +72,56 @@ class ContatoService:
             return None
         return ContatoOut.model_validate(contato)
 
+    def get_contato_with_etag(
+        self, db: Session, contato_id: int
+    ) -> Optional[Tuple[ContatoOut, str]]:
+        """Get a contact together with the ETag of the row that was read."""
+        contato = self.repository.get(db, contato_id)
+        if not contato:
+            return None
+        return ContatoOut.model_validate(contato), self.etag_for(contato)
+
+    def contato_etag(self, db: Session, contato_id: int) -> Optional[str]:
+        """Get the current ETag of a contact, or None if it does not exist."""
+        version = self.repository.get_version(db, contato_id)
+        if not version:
+            return None
+        return self.etag_for(version)
+
+    @staticmethod
+    def etag_for(contato: Union[Contato, Row]) -> str:
+        """Build the ETag of a contact from its id and row version."""
+        return make_etag("contato", contato.id, contato.version)
+
+    @staticmethod
+    def list_etag(
+        contatos: List[Contato],
+        skip: int = 0,
+        limit: int = 100,
+        motivo: Optional[str] = None,
+        status_mcp: Optional[str] = None,
+    ) -> str:
+        """Build the ETag of a listing page from its query and row versions."""
+        versions = [(c.id, c.version) for c in contatos]
+        return make_etag("contatos", skip, limit, motivo, status_mcp, versions)
+
+    def list_contatos_with_etag(
+        self,
+        db: Session,
+        skip: int = 0,
+        limit: int = 100,
+        motivo: Optional[str] = None,
+        status_mcp: Optional[str] = None,
+    ) -> Tuple[List[Contato], str]:
+        """List a page of contact rows (not yet serialized) and its ETag."""
+        contatos = self.repository.list_all(db, skip, limit, motivo, status_mcp)
+        return contatos, self.list_etag(contatos, skip, limit, motivo, status_mcp)
+
+    @staticmethod
+    def to_out(contatos: List[Contato]) -> List[ContatoOut]:
+        """Serialize contact rows."""
+        return [ContatoOut.model_validate(c) for c in contatos]
+
     def list_contatos(
         self,
         db: Session,
@@ -80,18 +138,48 @@ class ContatoService:
         self, db: Session, contato_id: int, data: ContatoUpdate
     ) -> Optional[ContatoOut]:
         """Update an existing contact."""
+        result = self.update_contato_with_etag(db, contato_id, data)
+        return result[0] if result else None
+
+    def update_contato_with_etag(
+        self,
+        db: Session,
+        contato_id: int,
+        data: ContatoUpdate,
+        if_match: Optional[str] = None,
+    ) -> Optional[Tuple[ContatoOut, str]]:
+        """Update an existing contact, returning it with its new ETag.
+
+        With ``if_match`` the update only happens if the contact still has
+        that ETag when the row is written; otherwise ``PreconditionFailedError``.
+        """
         contato_data = data.model_dump(exclude_unset=True)
 
+        expected_version = None
+        if if_match:
+            version = self.repository.get_version(db, contato_id)
+            if not version:
+                return None
+            if not etag_matches(if_match, self.etag_for(version), weak=False):
+                raise PreconditionFailedError("Contact was modified by another request")
+            expected_version = version.version
+
         # Check for duplicate phone if telefone is being updated
         if "telefone" in contato_data:
             existing = self.repository.get_by_telefone(db, contato_data["telefone"])
             if existing and existing.id != contato_id:
                 raise ValueError("Contact with this phone number already exists")
 
-        contato = self.repository.update(db, contato_id, contato_data)
+        try:
+            contato = self.repository.update(
+                db, contato_id, contato_data, expected_version
+            )
+        except StaleDataError:
+            db.rollback()
+            raise PreconditionFailedError("Contact was modified by another request")
         if not contato:
             return None
-        return ContatoOut.model_validate(contato)
+        return ContatoOut.model_validate(contato), self.etag_for(contato)
 
     def delete_contato(self, db: Session, contato_id: int) -> bool:
         """Delete a contact."""
@@ -1,63 +1,22 @@
 """LLM integration service."""
 
 from typing import Dict, Any
-import httpx
 import structlog
-from tenacity import retry, stop_after_attempt, wait_exponential
 
 from app.core.config import settings
+from app.core.metrics import observe_llm_call
 
 logger = structlog.get_logger()
 
+EXTRACTION_SYSTEM_PROMPT = """Você é um assistente especializado em extrair informações estruturadas de texto livre.
 
-class LLMIntegration:
-    """Integration with LLM service via Ollama for entity extraction."""
-
-    def __init__(self, base_url: str = None):
-        self.base_url = base_url or settings.LLM_URL
-        self.timeout = settings.LLM_TIMEOUT
-
-    @retry(
-        stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=1, max=10)
-    )
-    async def extract_entities(self, text: str) -> Dict[str, Any]:
-        """Extract named entities from free text using LLM."""
-        logger.info("llm_extraction_start", text_preview=text[:50])
-
-        prompt = self._build_extraction_prompt(text)
-
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/api/generate",
-                    json={"model": "llama3:8b", "prompt": prompt, "stream": False},
-                )
-                response.raise_for_status()
-
-                result = response.json()
-                entities = self._parse_entities(result.get("response", ""))
-
-                logger.info("llm_extraction_success", entities=entities)
-                return entities
-
-        except Exception as e:
-            logger.error("llm_extraction_failure", error=str(e))
-            raise
-
-    def _build_extraction_prompt(self, text: str) -> str:
-        """Build prompt for entity extraction."""
-        return f"""Você é um assistente especializado em extrair informações estruturadas de texto livre.
-
-Tarefa: Extraia as seguintes entidades do texto fornecido:
+Tarefa: Extraia as seguintes entidades do texto de entrada enviado pelo usuário:
 - nome: Nome completo da pessoa
 - telefone: Número de telefone no formato brasileiro (XX) XXXXX-XXXX
 - email: Email válido (opcional)
 - motivo: Motivo do contato (apoio emocional, orientação jurídica, etc.)
 - data: Data do contato se mencionada (formato YYYY-MM-DD)
 
-Texto de entrada:
-{text}
-
 Instruções:
 1. Extraia APENAS as entidades explicitamente mencionadas no texto
 2. Se uma entidade não for mencionada, retorne null
@@ -66,15 +25,86 @@ Instruções:
 5. Retorne APENAS JSON válido, sem markdown, sem explicações
 
 Formato de saída (JSON):
-{{
+{
   "nome": "...",
   "telefone": "...",
   "email": "..." ou null,
   "motivo": "...",
   "data": "..." ou null
-}}
+}
 """
 
+
+class LLMIntegration:
+    """Integration with LLM service via Ollama for entity extraction."""
+
+    def __init__(self, base_url: str = None):
+        self.base_url = base_url or settings.LLM_URL
+        self.timeout = settings.LLM_TIMEOUT
+
+    async def extract_entities(self, text: str) -> Dict[str, Any]:
+        """Extract named entities from free text using LLM (3 attempts)."""
+        # tenacity is only needed once a request actually reaches the LLM
+        from tenacity import AsyncRetrying, stop_after_attempt, wait_exponential
+
+        async for attempt in AsyncRetrying(
+            stop=stop_after_attempt(3),
+            wait=wait_exponential(multiplier=1, min=1, max=10),
+        ):
+            with attempt:
+                return await self._extract_entities(text)
+        raise AssertionError("unreachable")  # AsyncRetrying raises RetryError
+
+    async def _extract_entities(self, text: str) -> Dict[str, Any]:
+        """Run one extraction attempt."""
+        logger.info("llm_extraction_start", text_preview=text[:50])
+
+        prompt = self._build_extraction_prompt(text)
+
+        try:
+            with observe_llm_call("extract"):
+                result = await self._generate(prompt)
+            entities = self._parse_entities(result.get("response", ""))
+
+            logger.info(
+                "llm_extraction_success",
+                entities=entities,
+                prompt_eval_count=result.get("prompt_eval_count"),
+                prompt_eval_duration_ns=result.get("prompt_eval_duration"),
+            )
+            return entities
+
+        except Exception as e:
+            logger.error("llm_extraction_failure", error=str(e))
+            raise
+
+    async def _generate(self, prompt: str) -> Dict[str, Any]:
+        """Call Ollama's generate endpoint."""
+        import httpx
+
+        async with httpx.AsyncClient(timeout=self.timeout) as client:
+            response = await client.post(
+                f"{self.base_url}/api/generate",
+                json={
+                    "model": "llama3:8b",
+                    "system": EXTRACTION_SYSTEM_PROMPT,
+                    "prompt": prompt,
+                    "stream": False,
+                    "options": {"num_predict": settings.LLM_NUM_PREDICT},
+                },
+            )
+            response.raise_for_status()
+            return response.json()
+
+    def _build_extraction_prompt(self, text: str) -> str:
+        """Build the variable part of the extraction prompt.
+
+        The instructions travel separately as EXTRACTION_SYSTEM_PROMPT so
+        every request shares the same prefix and Ollama reuses its cached
+        evaluation, paying only for the tokens of ``text``.
+        """
+        return f"Texto de entrada:\n{text}\n"
+
     def _parse_entities(self, response: str) -> Dict[str, str]:
         """Parse LLM response to extract entities."""
         import json
@@ -0,0 +1 @@
+"""Microbenchmarks for CPU-bound hot paths."""
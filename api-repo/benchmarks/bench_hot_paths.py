@@ -0,0 +1,85 @@
+"""Benchmarks for the API service's pure-Python hot paths."""
+
+from datetime import datetime
+from unittest.mock import patch
+
+from benchmarks.runner import benchmark
+
+LLM_OUTPUTS = [
+    '{"nome": "Maria Silva", "telefone": "11-99999-8888", '
+    '"email": "maria@example.com", "motivo": "apoio emocional", "data": null}',
+    'Aqui está o JSON extraído:\n```json\n{\n  "nome": "João Pereira",\n'
+    '  "telefone": "(21) 98888-7777",\n  "email": null,\n'
+    '  "motivo": "orientação jurídica",\n  "data": "2024-03-15"\n}\n```\n',
+    "Desculpe, não consegui identificar os dados no texto.",
+]
+
+PHONES = ["(11) 99999-8888", "11 3333 4444", "+55 21 98888-7777", "invalid"]
+
+
+def _rows(count):
+    from app.models.contato import Contato
+
+    now = datetime(2024, 1, 1, 10, 0, 0)
+    rows = []
+    for i in range(count):
+        contato = Contato(
+            id=i + 1,
+            nome=f"Pessoa {i}",
+            telefone=f"11-9{i % 10000:04d}-{i % 10000:04d}",
+            email=f"pessoa{i}@example.com" if i % 3 else None,
+            motivo="apoio emocional" if i % 2 else "orientação jurídica",
+            data_cadastro=now,
+            status_mcp="pendente",
+            created_at=now,
+            version=1,
+        )
+        rows.append(contato)
+    return rows
+
+
+@benchmark("llm_integration._normalize_phone", number=20000)
+def bench_normalize_phone():
+    from app.services.llm_integration import LLMIntegration
+
+    normalize = LLMIntegration()._normalize_phone
+    return lambda: [normalize(p) for p in PHONES]
+
+
+@benchmark("llm_integration._parse_entities", number=5000)
+def bench_parse_entities():
+    from app.services.llm_integration import LLMIntegration
+
+    parse = LLMIntegration()._parse_entities
+    return lambda: [parse(output) for output in LLM_OUTPUTS]
+
+
+@benchmark("ContatoOut.model_validate[1000]", number=10, rounds=5)
+def bench_model_validate_1000():
+    from app.schemas.contato import ContatoOut
+
+    rows = _rows(1000)
+    return lambda: [ContatoOut.model_validate(r) for r in rows]
+
+
+def _export(count):
+    from app.services.crud_service import ContatoService
+
+    rows = _rows(count)
+    service = ContatoService()
+
+    def run():
+        with patch.object(service.repository, "list_all", return_value=rows):
+            return service.export_to_excel(None)
+
+    return run
+
+
+@benchmark("export_to_excel[10k]", number=1, rounds=3)
+def bench_export_10k():
+    return _export(10_000)
+
+
+@benchmark("export_to_excel[100k]", number=1, rounds=1)
+def bench_export_100k():
+    return _export(100_000)
@@ -0,0 +1,156 @@
+"""Startup budget check for the API service.
+
+Measures, in fresh interpreters:
+
+* the time to ``import app.main`` (best of ``--repeat`` runs), and that it
+  neither loads heavy optional modules nor touches the database;
+* the time from launching uvicorn to the first successful ``GET /health``.
+
+Exits with status 1 when a budget is exceeded, so it can gate CI before a
+change slows down scale-out and rolling restarts. Run from ``api-repo``::
+
+    python scripts/check_startup.py
+    python scripts/check_startup.py --import-budget 1.0 --first-request-budget 2.5
+    python scripts/check_startup.py --no-serve    # import checks only
+"""
+
+import argparse
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from typing import Dict, List, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Loaded on first use (export, LLM calls); importing them at startup is a bug
+HEAVY_MODULES = ("pandas", "openpyxl", "tenacity", "httpx")
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import app.main
+elapsed = time.perf_counter() - start
+heavy = {heavy!r}
+print(json.dumps({{
+    "seconds": elapsed,
+    "loaded": sorted(m for m in heavy if m in sys.modules),
+}}))
+"""
+
+
+def _env(database_path: str) -> Dict[str, str]:
+    env = dict(os.environ)
+    env["DATABASE_URL"] = f"sqlite:///{database_path}"
+    env.pop("AUTO_CREATE_SCHEMA", None)
+    return env
+
+
+def measure_import(repeat: int) -> Dict:
+    """Import app.main in fresh interpreters; report the best time."""
+    runs = []
+    with tempfile.TemporaryDirectory() as tmp:
+        database_path = os.path.join(tmp, "startup-check.db")
+        for _ in range(repeat):
+            output = subprocess.run(
+                [sys.executable, "-c", _PROBE.format(heavy=HEAVY_MODULES)],
+                cwd=ROOT,
+                env=_env(database_path),
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout
+            runs.append(json.loads(output.strip().splitlines()[-1]))
+        touched_database = os.path.exists(database_path)
+    return {
+        "seconds": min(r["seconds"] for r in runs),
+        "loaded": runs[-1]["loaded"],
+        "touched_database": touched_database,
+    }
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def measure_first_request(timeout: float) -> Optional[float]:
+    """Launch uvicorn and time until GET /health answers 200 (None on timeout)."""
+    port = _free_port()
+    url = f"http://127.0.0.1:{port}/health"
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        server = subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "uvicorn",
+                "app.main:app",
+                "--port",
+                str(port),
+                "--log-level",
+                "warning",
+            ],
+            cwd=ROOT,
+            env=_env(os.path.join(tmp, "startup-check.db")),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            while time.perf_counter() - start < timeout:
+                if server.poll() is not None:
+                    return None
+                try:
+                    with urllib.request.urlopen(url, timeout=1) as response:
+                        if response.status == 200:
+                            return time.perf_counter() - start
+                except OSError:
+                    time.sleep(0.02)
+            return None
+        finally:
+            server.terminate()
+            server.wait(timeout=10)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--import-budget", type=float, default=1.5, help="seconds")
+    parser.add_argument(
+        "--first-request-budget", type=float, default=3.0, help="seconds"
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--no-serve", action="store_true", help="skip uvicorn")
+    args = parser.parse_args(argv)
+
+    failures = []
+    result = measure_import(args.repeat)
+    print(f"import app.main: {result['seconds']:.3f}s")  # noqa: T201
+    if result["seconds"] > args.import_budget:
+        failures.append(f"import took longer than {args.import_budget:.2f}s")
+    if result["loaded"]:
+        failures.append(f"heavy modules imported at startup: {result['loaded']}")
+    if result["touched_database"]:
+        failures.append("importing the app connected to the database")
+
+    if not args.no_serve:
+        first = measure_first_request(args.first_request_budget * 3)
+        shown = "timeout" if first is None else f"{first:.3f}s"
+        print(f"time to first request: {shown}")  # noqa: T201
+        if first is None or first > args.first_request_budget:
+            failures.append(
+                f"first request took longer than {args.first_request_budget:.2f}s"
+            )
+
+    for failure in failures:
+        print(f"FAILED {failure}")  # noqa: T201
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
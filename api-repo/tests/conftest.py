@@ -3,15 +3,19 @@
 import pytest
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 from fastapi.testclient import TestClient
 
 from app.core.database import Base, get_db
 from app.main import app
 
-# Create test database
-SQLALCHEMY_TEST_DATABASE_URL = "sqlite:///./test.db"
+# Create test database (in-memory and private to this process, so parallel
+# pytest runs cannot see or lock each other's rows)
+SQLALCHEMY_TEST_DATABASE_URL = "sqlite://"
 engine = create_engine(
-    SQLALCHEMY_TEST_DATABASE_URL, connect_args={"check_same_thread": False}
+    SQLALCHEMY_TEST_DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
 )
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
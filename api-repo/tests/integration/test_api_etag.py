@@ -0,0 +1,152 @@
+"""Integration tests for ETag and conditional requests on contact endpoints."""
+
+
+def test_get_contato_returns_etag_and_304(client, sample_contato_data):
+    """Test single contact GET honours If-None-Match."""
+    contato_id = client.post("/api/v1/contatos", json=sample_contato_data).json()["id"]
+
+    response = client.get(f"/api/v1/contatos/{contato_id}")
+    etag = response.headers["ETag"]
+
+    assert response.status_code == 200
+
+    cached = client.get(
+        f"/api/v1/contatos/{contato_id}", headers={"If-None-Match": etag}
+    )
+
+    assert cached.status_code == 304
+    assert cached.headers["ETag"] == etag
+    assert cached.content == b""
+
+
+def test_get_contato_etag_changes_after_update(client, sample_contato_data):
+    """Test the ETag of a contact changes once it is modified."""
+    contato_id = client.post("/api/v1/contatos", json=sample_contato_data).json()["id"]
+    etag = client.get(f"/api/v1/contatos/{contato_id}").headers["ETag"]
+
+    client.put(f"/api/v1/contatos/{contato_id}", json={"nome": "Maria Souza"})
+    response = client.get(
+        f"/api/v1/contatos/{contato_id}", headers={"If-None-Match": etag}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+def test_list_contatos_returns_304_until_collection_changes(
+    client, sample_contato_data
+):
+    """Test collection ETag is stable until a contact is added."""
+    client.post("/api/v1/contatos", json=sample_contato_data)
+    etag = client.get("/api/v1/contatos").headers["ETag"]
+
+    cached = client.get("/api/v1/contatos", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+
+    client.post(
+        "/api/v1/contatos",
+        json={"nome": "João", "telefone": "11-8888-7777", "motivo": "orientação"},
+    )
+    changed = client.get("/api/v1/contatos", headers={"If-None-Match": etag})
+
+    assert changed.status_code == 200
+    assert len(changed.json()) == 2
+
+
+def test_list_contatos_etag_changes_after_update(client, sample_contato_data):
+    """Test collection ETag changes when a listed contact is updated."""
+    contato_id = client.post("/api/v1/contatos", json=sample_contato_data).json()["id"]
+    etag = client.get("/api/v1/contatos").headers["ETag"]
+
+    client.put(f"/api/v1/contatos/{contato_id}", json={"nome": "Maria Souza"})
+    changed = client.get("/api/v1/contatos", headers={"If-None-Match": etag})
+
+    assert changed.status_code == 200
+    assert changed.json()[0]["nome"] == "Maria Souza"
+
+
+def test_list_contatos_etag_changes_after_delete(client, sample_contato_data):
+    """Test collection ETag changes when a listed contact is deleted."""
+    contato_id = client.post("/api/v1/contatos", json=sample_contato_data).json()["id"]
+    client.post(
+        "/api/v1/contatos",
+        json={"nome": "João", "telefone": "11-8888-7777", "motivo": "orientação"},
+    )
+    etag = client.get("/api/v1/contatos").headers["ETag"]
+
+    client.delete(f"/api/v1/contatos/{contato_id}")
+    changed = client.get("/api/v1/contatos", headers={"If-None-Match": etag})
+
+    assert changed.status_code == 200
+    assert len(changed.json()) == 1
+
+
+def test_list_contatos_etag_depends_on_query(client, sample_contato_data):
+    """Test different pages of the same collection get different ETags."""
+    client.post("/api/v1/contatos", json=sample_contato_data)
+
+    first = client.get("/api/v1/contatos?limit=10").headers["ETag"]
+    second = client.get("/api/v1/contatos?limit=20").headers["ETag"]
+
+    assert first != second
+
+
+def test_update_contato_with_matching_if_match(client, sample_contato_data):
+    """Test PUT succeeds when If-Match carries the current ETag."""
+    contato_id = client.post("/api/v1/contatos", json=sample_contato_data).json()["id"]
+    etag = client.get(f"/api/v1/contatos/{contato_id}").headers["ETag"]
+
+    response = client.put(
+        f"/api/v1/contatos/{contato_id}",
+        json={"nome": "Maria Souza"},
+        headers={"If-Match": etag},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+def test_update_contato_with_previous_etag_after_concurrent_write(
+    client, sample_contato_data
+):
+    """Test a second writer holding the old ETag gets 412 instead of overwriting."""
+    contato_id = client.post("/api/v1/contatos", json=sample_contato_data).json()["id"]
+    etag = client.get(f"/api/v1/contatos/{contato_id}").headers["ETag"]
+
+    first = client.put(
+        f"/api/v1/contatos/{contato_id}",
+        json={"nome": "Maria Souza"},
+        headers={"If-Match": etag},
+    )
+    second = client.put(
+        f"/api/v1/contatos/{contato_id}",
+        json={"nome": "Maria Santos"},
+        headers={"If-Match": etag},
+    )
+
+    assert first.status_code == 200
+    assert second.status_code == 412
+    assert client.get(f"/api/v1/contatos/{contato_id}").json()["nome"] == "Maria Souza"
+
+
+def test_update_contato_with_stale_if_match(client, sample_contato_data):
+    """Test PUT fails with 412 when If-Match is stale."""
+    contato_id = client.post("/api/v1/contatos", json=sample_contato_data).json()["id"]
+
+    response = client.put(
+        f"/api/v1/contatos/{contato_id}",
+        json={"nome": "Maria Souza"},
+        headers={"If-Match": '"stale"'},
+    )
+
+    assert response.status_code == 412
+    assert client.get(f"/api/v1/contatos/{contato_id}").json()["nome"] == "Maria Silva"
+
+
+def test_update_contato_if_match_not_found(client):
+    """Test PUT with If-Match on a missing contact returns 404."""
+    response = client.put(
+        "/api/v1/contatos/99999", json={"nome": "X"}, headers={"If-Match": '"x"'}
+    )
+
+    assert response.status_code == 404
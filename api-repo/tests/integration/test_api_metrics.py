@@ -0,0 +1,40 @@
+"""Integration tests for the Prometheus metrics endpoint."""
+
+
+def test_metrics_endpoint_exposes_prometheus_text(client):
+    """Test /metrics serves the Prometheus exposition format."""
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "http_request_duration_seconds" in response.text
+
+
+def test_metrics_use_route_template_not_raw_path(client, sample_contato_data):
+    """Test request latency is labelled with the route template."""
+    contato_id = client.post("/api/v1/contatos", json=sample_contato_data).json()["id"]
+    client.get(f"/api/v1/contatos/{contato_id}")
+
+    body = client.get("/metrics").text
+
+    assert 'route="/api/v1/contatos/{id}"' in body
+    assert f'route="/api/v1/contatos/{contato_id}"' not in body
+
+
+def test_metrics_record_repository_operations(client, sample_contato_data):
+    """Test ContatoRepository calls are timed per operation."""
+    client.post("/api/v1/contatos", json=sample_contato_data)
+
+    body = client.get("/metrics").text
+
+    assert 'db_query_duration_seconds_count{operation="create"}' in body
+
+
+def test_metrics_unmatched_route_label(client):
+    """Test unknown paths collapse into a single label value."""
+    client.get("/does-not-exist/12345")
+
+    body = client.get("/metrics").text
+
+    assert 'route="<unmatched>"' in body
+    assert "12345" not in body
@@ -1,6 +1,10 @@
 """Unit tests for CRUD operations."""
 
+import pytest
+from sqlalchemy.orm.exc import StaleDataError
+
 from app.crud.contato import ContatoRepository
+from app.models.contato import Contato
 
 
 def test_create_contato(db, sample_contato_data):
@@ -121,3 +125,41 @@ def test_count_contatos(db):
 
     count = ContatoRepository.count(db)
     assert count == 3
+
+
+def test_update_contato_bumps_version(db, sample_contato_data):
+    """Test every update increments the row version."""
+    contato = ContatoRepository.create(db, sample_contato_data)
+    assert contato.version == 1
+
+    updated = ContatoRepository.update(db, contato.id, {"nome": "Maria Souza"})
+
+    assert updated.version == 2
+    assert ContatoRepository.get_version(db, contato.id).version == 2
+
+
+def test_update_contato_expected_version_mismatch(db, sample_contato_data):
+    """Test a compare-and-set update with a stale version is rejected."""
+    contato = ContatoRepository.create(db, sample_contato_data)
+    ContatoRepository.update(db, contato.id, {"nome": "Maria Souza"})
+
+    with pytest.raises(StaleDataError):
+        ContatoRepository.update(
+            db, contato.id, {"nome": "Maria Santos"}, expected_version=1
+        )
+
+
+def test_update_contato_concurrent_write_is_detected(db, sample_contato_data):
+    """Test the UPDATE itself is conditional on the version that was read."""
+    contato = ContatoRepository.create(db, sample_contato_data)
+    # Another transaction bumps the version after this session loaded the row
+    db.execute(
+        Contato.__table__.update()
+        .where(Contato.id == contato.id)
+        .values(version=Contato.version + 1)
+    )
+
+    contato.nome = "Maria Santos"
+    with pytest.raises(StaleDataError):
+        db.commit()
+    db.rollback()
@@ -0,0 +1,24 @@
+"""Unit tests for ETag helpers."""
+
+from app.core.etag import etag_matches, make_etag
+
+
+def test_make_etag_is_quoted_and_stable():
+    """Test ETags are strong, quoted and deterministic."""
+    etag = make_etag("contato", 1, None)
+
+    assert etag.startswith('"') and etag.endswith('"')
+    assert etag == make_etag("contato", 1, None)
+    assert etag != make_etag("contato", 2, None)
+
+
+def test_etag_matches_weak_and_strong():
+    """Test weak and strong comparison of conditional headers."""
+    etag = make_etag("x")
+
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", {etag}', etag)
+    assert etag_matches("*", etag)
+    assert etag_matches(f"W/{etag}", etag)
+    assert not etag_matches(f"W/{etag}", etag, weak=False)
+    assert not etag_matches(None, etag)
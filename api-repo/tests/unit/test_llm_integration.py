@@ -2,7 +2,7 @@
 
 import pytest
 from unittest.mock import AsyncMock, patch
-from app.services.llm_integration import LLMIntegration
+from app.services.llm_integration import EXTRACTION_SYSTEM_PROMPT, LLMIntegration
 
 
 @pytest.mark.asyncio
@@ -64,8 +64,41 @@ def test_build_extraction_prompt():
     text = "Novo contato: João, tel 11-8888-7777"
     prompt = llm._build_extraction_prompt(text)
 
-    assert text in prompt
-    assert "nome" in prompt
-    assert "telefone" in prompt
-    assert "email" in prompt
-    assert "motivo" in prompt
+    assert prompt.rstrip().endswith(text)
+    assert "nome" in EXTRACTION_SYSTEM_PROMPT
+    assert "telefone" in EXTRACTION_SYSTEM_PROMPT
+    assert "email" in EXTRACTION_SYSTEM_PROMPT
+    assert "motivo" in EXTRACTION_SYSTEM_PROMPT
+
+
+@pytest.mark.asyncio
+async def test_generate_sends_constant_system_prompt():
+    """Test the instructions go in the system field, not the prompt."""
+    with patch("httpx.AsyncClient.post") as mock_post:
+        mock_post.return_value = AsyncMock(
+            json=lambda: {"response": "{}"}, raise_for_status=lambda: None
+        )
+
+        await LLMIntegration(base_url="http://test-ollama").extract_entities("Oi")
+
+    payload = mock_post.call_args.kwargs["json"]
+    assert payload["system"] == EXTRACTION_SYSTEM_PROMPT
+    assert "Tarefa" not in payload["prompt"]
+
+
+@pytest.mark.asyncio
+async def test_extract_entities_records_llm_metrics():
+    """Test LLM calls are counted by outcome."""
+    from prometheus_client import REGISTRY
+
+    labels = {"operation": "extract", "outcome": "success"}
+    before = REGISTRY.get_sample_value("llm_calls_total", labels) or 0
+    mock_response = {"response": '{"nome": "Maria Silva"}'}
+
+    with patch("httpx.AsyncClient.post") as mock_post:
+        mock_post.return_value = AsyncMock(
+            json=lambda: mock_response, raise_for_status=lambda: None
+        )
+        await LLMIntegration(base_url="http://test-ollama").extract_entities("Maria")
+
+    assert REGISTRY.get_sample_value("llm_calls_total", labels) == before + 1
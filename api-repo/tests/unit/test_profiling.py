@@ -0,0 +1,114 @@
+"""Unit tests for request profiling."""
+
+import time
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.core.profiling import CaptureStore, ProfilingMiddleware
+
+
+def _busy(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def _profiled_app(store):
+    app = FastAPI()
+
+    @app.get("/busy")
+    async def busy():
+        _busy(0.2)
+        return {"ok": True}
+
+    @app.get("/fast")
+    async def fast():
+        return {"ok": True}
+
+    app.add_middleware(ProfilingMiddleware, store=store)
+    return app
+
+
+def test_capture_store_is_bounded(tmp_path):
+    """Test the oldest captures are evicted beyond the limit."""
+    store = CaptureStore(str(tmp_path), max_captures=2)
+
+    names = [store.save(f"GET-/x/{i}", ["a;b 1"]) for i in range(4)]
+
+    listed = [c["name"] for c in store.list()]
+    assert len(listed) == 2
+    assert names[-1] in listed
+    assert store.read(names[-1]) == "a;b 1\n"
+
+
+def test_capture_store_rejects_path_traversal(tmp_path):
+    """Test only capture file names can be read."""
+    store = CaptureStore(str(tmp_path), max_captures=2)
+
+    assert store.read("../../etc/passwd") is None
+    assert store.read("missing.collapsed") is None
+
+
+def test_forced_profile_with_token(tmp_path, monkeypatch):
+    """Test an authorized X-Profile header captures the request."""
+    monkeypatch.setattr(settings, "PROFILE_TOKEN", "secret")
+    monkeypatch.setattr(settings, "PROFILE_SLOW_THRESHOLD_MS", 0)
+    monkeypatch.setattr(settings, "PROFILE_SAMPLE_INTERVAL_MS", 1)
+    store = CaptureStore(str(tmp_path), max_captures=5)
+    client = TestClient(_profiled_app(store))
+
+    client.get("/busy", headers={"X-Profile": "secret"})
+
+    captures = store.list()
+    assert len(captures) == 1
+    assert "busy" in store.read(captures[0]["name"])
+
+
+def test_unauthorized_header_does_not_profile(tmp_path, monkeypatch):
+    """Test a wrong token does not trigger a capture."""
+    monkeypatch.setattr(settings, "PROFILE_TOKEN", "secret")
+    monkeypatch.setattr(settings, "PROFILE_SLOW_THRESHOLD_MS", 0)
+    store = CaptureStore(str(tmp_path), max_captures=5)
+    client = TestClient(_profiled_app(store))
+
+    client.get("/busy", headers={"X-Profile": "wrong"})
+
+    assert store.list() == []
+
+
+def test_slow_request_is_captured(tmp_path, monkeypatch):
+    """Test requests over the threshold are captured automatically."""
+    monkeypatch.setattr(settings, "PROFILE_TOKEN", None)
+    monkeypatch.setattr(settings, "PROFILE_SLOW_THRESHOLD_MS", 100)
+    monkeypatch.setattr(settings, "PROFILE_SAMPLE_INTERVAL_MS", 1)
+    store = CaptureStore(str(tmp_path), max_captures=5)
+    client = TestClient(_profiled_app(store))
+
+    client.get("/fast")
+    client.get("/busy")
+
+    captures = store.list()
+    assert len(captures) == 1
+    assert "busy" in captures[0]["name"]
+
+
+def test_profile_endpoints_require_token(client, tmp_path, monkeypatch):
+    """Test captures are listed and fetched only with the debug token."""
+    monkeypatch.setattr(settings, "PROFILE_TOKEN", "secret")
+    monkeypatch.setattr(settings, "PROFILE_DIR", str(tmp_path))
+    name = CaptureStore(str(tmp_path), 5).save("GET-/x", ["main;work 3"])
+
+    assert client.get("/debug/profiles").status_code == 404
+    listed = client.get("/debug/profiles", headers={"X-Profile": "secret"})
+    fetched = client.get(f"/debug/profiles/{name}", headers={"X-Profile": "secret"})
+
+    assert listed.json()["captures"][0]["name"] == name
+    assert fetched.text == "main;work 3\n"
+    assert (
+        client.get(
+            "/debug/profiles/missing.collapsed", headers={"X-Profile": "secret"}
+        ).status_code
+        == 404
+    )
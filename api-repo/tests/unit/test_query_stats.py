@@ -0,0 +1,54 @@
+"""Unit tests for SQL query instrumentation."""
+
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.core import query_stats
+from app.core.query_stats import QueryStats, explain
+
+
+def test_statements_are_counted_per_request(db, sample_contato_data, monkeypatch):
+    """Test the hooks count statements into the active QueryStats."""
+    stats = QueryStats()
+    token = query_stats._current.set(stats)
+    try:
+        db.execute(text("SELECT 1"))
+        db.execute(text("SELECT 2"))
+    finally:
+        query_stats._current.reset(token)
+
+    assert stats.count == 2
+    assert stats.total_time > 0
+
+
+def test_slow_query_is_logged_with_plan(db, monkeypatch):
+    """Test statements above SLOW_QUERY_MS are logged with EXPLAIN output."""
+    logged = []
+    monkeypatch.setattr(settings, "SLOW_QUERY_MS", 0)
+    monkeypatch.setattr(
+        query_stats.logger, "warning", lambda event, **kw: logged.append((event, kw))
+    )
+
+    db.execute(text("SELECT * FROM contatos WHERE telefone = :t"), {"t": "x"})
+
+    slow = [kw for event, kw in logged if event == "slow_query"]
+    assert slow
+    assert any("ix_contatos_telefone" in line for line in slow[-1]["plan"])
+
+
+def test_explain_skips_writes():
+    """Test only SELECT statements are explained."""
+    assert explain("sqlite", None, "DELETE FROM contatos", ()) is None
+    assert explain("mssql", None, "SELECT 1", ()) is None
+
+
+def test_debug_headers(client, sample_contato_data, monkeypatch):
+    """Test X-DB-Queries / X-DB-Time are returned in debug mode only."""
+    monkeypatch.setattr(settings, "DEBUG", True)
+    response = client.post("/api/v1/contatos", json=sample_contato_data)
+
+    assert int(response.headers["X-DB-Queries"]) >= 2
+    assert float(response.headers["X-DB-Time"]) >= 0
+
+    monkeypatch.setattr(settings, "DEBUG", False)
+    assert "X-DB-Queries" not in client.get("/api/v1/contatos").headers
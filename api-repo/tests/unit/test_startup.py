@@ -0,0 +1,54 @@
+"""Unit tests for application startup."""
+
+import os
+import subprocess
+import sys
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.main import app
+
+API_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+
+
+def test_import_skips_heavy_modules_and_database():
+    """Test importing the app loads no heavy module and opens no database."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "scripts/check_startup.py",
+            "--no-serve",
+            "--repeat",
+            "1",
+            "--import-budget",
+            "30",
+        ],
+        cwd=API_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+
+    assert result.returncode == 0, result.stdout + result.stderr
+
+
+def test_lifespan_does_not_create_schema_by_default():
+    """Test tables are left to Alembic unless AUTO_CREATE_SCHEMA is set."""
+    with patch("app.main.Base.metadata.create_all") as create_all:
+        with TestClient(app):
+            pass
+
+    create_all.assert_not_called()
+
+
+def test_lifespan_creates_schema_when_enabled():
+    """Test AUTO_CREATE_SCHEMA creates the tables at startup."""
+    with patch.object(settings, "AUTO_CREATE_SCHEMA", True), patch(
+        "app.main.Base.metadata.create_all"
+    ) as create_all:
+        with TestClient(app):
+            pass
+
+    create_all.assert_called_once()
@@ -1,6 +1,6 @@
 """LLM Service configuration."""
 
-from typing import List
+from typing import Dict, List, Optional
 from pydantic_settings import BaseSettings
 
 
@@ -18,15 +18,36 @@ class Settings(BaseSettings):
     OLLAMA_MODEL: str = "llama3:8b"
     OLLAMA_TIMEOUT: int = 60
     OLLAMA_MAX_RETRIES: int = 3
+    # How long Ollama keeps the model in memory after each request
+    OLLAMA_KEEP_ALIVE: str = "30m"
+
+    # Warm-up and keep-warm: a tiny generation at startup gates readiness;
+    # during business hours the model is re-pinned every KEEPER_INTERVAL
+    WARMUP_ENABLED: bool = True
+    WARMUP_RETRY_SECONDS: int = 10
+    KEEPER_INTERVAL_SECONDS: int = 240
+    BUSINESS_HOURS_START: int = 7
+    BUSINESS_HOURS_END: int = 22
+    BUSINESS_DAYS: List[int] = [0, 1, 2, 3, 4, 5]  # Monday=0
+    BUSINESS_TIMEZONE: str = "America/Sao_Paulo"
 
     # MCP Configuration
     MCP_PORT: int = 8002
     MCP_HOST: str = "0.0.0.0"
+    # Records validated per column pass by /mcp/validate/batch
+    VALIDATE_BATCH_CHUNK_SIZE: int = 1000
 
     # Entity Extraction
     EXTRACTION_TIMEOUT: int = 30
     MAX_TEXT_LENGTH: int = 2000
     MIN_CONFIDENCE: float = 0.7
+    # Token budget: completion cap (the JSON answer is ~80 tokens), context
+    # sizes to choose from (few, since a new num_ctx reloads the model) and
+    # the compacted input length beyond which the text is truncated
+    DEFAULT_NUM_PREDICT: int = 512
+    EXTRACTION_NUM_PREDICT: int = 256
+    NUM_CTX_BUCKETS: List[int] = [2048, 4096, 8192]
+    COMPACT_MAX_CHARS: int = 1500
 
     # CORS
     CORS_ORIGINS: List[str] = ["*"]
@@ -35,9 +56,20 @@ class Settings(BaseSettings):
     LOG_LEVEL: str = "INFO"
     LOG_FORMAT: str = "json"
 
+    # Profiling (X-Profile header with PROFILE_TOKEN forces a capture;
+    # requests slower than PROFILE_SLOW_THRESHOLD_MS are captured, 0 = off)
+    PROFILE_TOKEN: Optional[str] = None
+    PROFILE_SLOW_THRESHOLD_MS: int = 8000
+    PROFILE_SAMPLE_INTERVAL_MS: int = 5
+    PROFILE_DIR: str = "profiles"
+    PROFILE_MAX_CAPTURES: int = 50
+
     # Prompt Templates
     PROMPT_TEMPLATE_PATH: str = "app/prompt_templates/"
     DEFAULT_TEMPLATE: str = "entity_extraction.jinja2"
+    # Traffic share per template variant, e.g.
+    # {"entity_extraction_system": {"default": 0.9, "compact": 0.1}}
+    PROMPT_VARIANT_WEIGHTS: Dict[str, Dict[str, float]] = {}
 
     class Config:
         env_file = ".env"
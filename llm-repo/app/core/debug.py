@@ -0,0 +1,32 @@
+"""Endpoints to list and fetch captured request profiles."""
+
+from typing import Optional
+
+from fastapi import APIRouter, Header, HTTPException, Response
+
+from app.core.config import settings
+from app.core.profiling import PROFILES_PATH, CaptureStore, is_authorized
+
+router = APIRouter(prefix=PROFILES_PATH)
+
+
+def _store(x_profile: Optional[str]) -> CaptureStore:
+    # 404 rather than 401/403 so the endpoints do not advertise themselves
+    if not is_authorized(x_profile):
+        raise HTTPException(status_code=404, detail="Not found")
+    return CaptureStore(settings.PROFILE_DIR, settings.PROFILE_MAX_CAPTURES)
+
+
+@router.get("", include_in_schema=False)
+async def list_profiles(x_profile: Optional[str] = Header(None)):
+    """List captured profiles, newest first."""
+    return {"captures": _store(x_profile).list()}
+
+
+@router.get("/{name}", include_in_schema=False)
+async def get_profile(name: str, x_profile: Optional[str] = Header(None)):
+    """Fetch a capture in collapsed-stack format."""
+    content = _store(x_profile).read(name)
+    if content is None:
+        raise HTTPException(status_code=404, detail="Capture not found")
+    return Response(content=content, media_type="text/plain")
@@ -1,6 +1,10 @@
 """Health check endpoints."""
 
 from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+
+from app.core.config import settings
+from app.core.warmup import warmup
 
 router = APIRouter()
 
@@ -13,6 +17,15 @@ async def health_check():
 
 @router.get("/ready")
 async def readiness_check():
-    """Readiness check endpoint."""
-    # TODO: Add Ollama connectivity check
-    return {"status": "ready", "service": "llm-service"}
+    """Readiness check: ready once the model is loaded and warmed up."""
+    if not warmup.ready:
+        return JSONResponse(
+            status_code=503,
+            content={
+                "status": "warming_up",
+                "service": "llm-service",
+                "model": settings.OLLAMA_MODEL,
+                "error": warmup.last_error,
+            },
+        )
+    return {"status": "ready", "service": "llm-service", "model": settings.OLLAMA_MODEL}
@@ -0,0 +1,189 @@
+"""Prometheus metrics and the HTTP instrumentation middleware."""
+
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator
+
+from prometheus_client import CONTENT_TYPE_LATEST, Counter, Gauge, Histogram
+from prometheus_client import generate_latest
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Latency buckets sized around the p95 targets (extraction < 3-5 s)
+HTTP_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+LLM_BUCKETS = (0.1, 0.25, 0.5, 1, 2, 3, 5, 8, 13, 20, 30, 60)
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ["method", "route", "status"],
+    buckets=HTTP_BUCKETS,
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "HTTP requests currently being served",
+    ["method"],
+)
+LLM_CALL_DURATION = Histogram(
+    "llm_call_duration_seconds",
+    "LLM call latency by outcome",
+    ["operation", "outcome"],
+    buckets=LLM_BUCKETS,
+)
+LLM_CALLS = Counter(
+    "llm_calls_total",
+    "LLM calls by outcome",
+    ["operation", "outcome"],
+)
+VALIDATION_FAILURES = Counter(
+    "validation_failures_total",
+    "DataValidator field validation failures",
+    ["field"],
+)
+PARSE_FAILURES = Counter(
+    "llm_parse_failures_total",
+    "EntityExtractor responses that did not contain parseable JSON",
+    ["reason"],
+)
+PROMPT_EVAL_TOKENS = Histogram(
+    "llm_prompt_eval_tokens",
+    "Prompt tokens Ollama evaluated (tokens served from its prefix cache excluded)",
+    ["operation"],
+    buckets=(8, 16, 32, 64, 128, 256, 512, 1024, 2048, 4096),
+)
+PROMPT_EVAL_DURATION = Histogram(
+    "llm_prompt_eval_duration_seconds",
+    "Time Ollama spent evaluating the prompt",
+    ["operation"],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2, 5),
+)
+PROMPT_LATENCY = Histogram(
+    "prompt_template_latency_seconds",
+    "Extraction LLM latency by prompt template version",
+    ["variant", "version"],
+    buckets=LLM_BUCKETS,
+)
+PROMPT_TOKENS = Counter(
+    "prompt_template_tokens_total",
+    "Prompt/completion tokens by prompt template version",
+    ["variant", "version", "kind"],
+)
+PROMPT_PARSES = Counter(
+    "prompt_template_parses_total",
+    "Extraction responses by prompt template version and parse outcome",
+    ["variant", "version", "outcome"],
+)
+LENGTH_LIMITED = Counter(
+    "llm_num_predict_exhausted_total",
+    "Extractions whose completion was cut off by num_predict",
+)
+MODEL_WARM = Gauge(
+    "llm_model_warm",
+    "1 once the model has been loaded and warmed up by this replica",
+)
+
+
+def route_template(scope: Scope) -> str:
+    """Resolve the route template of a request (bounded label cardinality).
+
+    Uses the route the router recorded in the scope when available, falling
+    back to matching the application's routes.
+    """
+    route = scope.get("route")
+    template = getattr(route, "path", None)
+    if template:
+        # Newer FastAPI versions record the route relative to its router's
+        # prefix; restore the prefix from the leading segments of the path.
+        segments = scope["path"].rstrip("/").split("/")
+        depth = len(template.rstrip("/").split("/")) - 1
+        prefix = "/".join(segments[: len(segments) - depth])
+        if prefix and not template.startswith(prefix + "/"):
+            return prefix + template
+        return template
+
+    app = scope.get("app")
+    for route in getattr(app, "routes", []):
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return getattr(route, "path", UNMATCHED_ROUTE)
+    return UNMATCHED_ROUTE
+
+
+class PrometheusMiddleware:
+    """ASGI middleware recording per-route latency and in-flight requests."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = "500"
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = str(message["status"])
+            await send(message)
+
+        in_progress = HTTP_REQUESTS_IN_PROGRESS.labels(method)
+        in_progress.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # Resolved after the call: routing has filled in the scope by now
+            route = route_template(scope)
+            HTTP_REQUEST_DURATION.labels(method, route, status).observe(
+                time.perf_counter() - start
+            )
+            in_progress.dec()
+
+
+@contextmanager
+def observe_llm_call(operation: str) -> Iterator[None]:
+    """Record duration and outcome (success/error) of an LLM call."""
+    start = time.perf_counter()
+    outcome = "error"
+    try:
+        yield
+        outcome = "success"
+    finally:
+        LLM_CALL_DURATION.labels(operation, outcome).observe(
+            time.perf_counter() - start
+        )
+        LLM_CALLS.labels(operation, outcome).inc()
+
+
+def observe_prompt_eval(operation: str, result: Dict[str, Any]) -> None:
+    """Record prompt_eval_count / prompt_eval_duration of an Ollama response."""
+    count = result.get("prompt_eval_count")
+    if count is not None:
+        PROMPT_EVAL_TOKENS.labels(operation).observe(count)
+    duration = result.get("prompt_eval_duration")
+    if duration is not None:
+        PROMPT_EVAL_DURATION.labels(operation).observe(duration / 1e9)
+
+
+def observe_prompt_template(
+    variant: str, version: str, seconds: float, result: Dict[str, Any], parsed: bool
+) -> None:
+    """Record latency, token counts and parse outcome of one prompt version."""
+    PROMPT_LATENCY.labels(variant, version).observe(seconds)
+    PROMPT_TOKENS.labels(variant, version, "prompt").inc(
+        result.get("prompt_eval_count") or 0
+    )
+    PROMPT_TOKENS.labels(variant, version, "completion").inc(
+        result.get("eval_count") or 0
+    )
+    PROMPT_PARSES.labels(variant, version, "success" if parsed else "failure").inc()
+
+
+def render_metrics() -> tuple:
+    """Render the default registry as (body, content type)."""
+    return generate_latest(), CONTENT_TYPE_LATEST
@@ -0,0 +1,99 @@
+"""Model warm-up, keep-warm and readiness state.
+
+At startup the service loads the model and runs one extraction-shaped
+generation so the first real request does not pay the model load (several
+seconds on llama3:8b). Readiness stays false until that has succeeded.
+During business hours a keeper re-pins the model every
+KEEPER_INTERVAL_SECONDS so Ollama never evicts it while traffic is
+expected; outside them the model is left to expire after OLLAMA_KEEP_ALIVE.
+"""
+
+import asyncio
+from datetime import datetime
+from typing import Optional
+from zoneinfo import ZoneInfo
+
+import structlog
+
+from app.core.config import settings
+from app.core.metrics import MODEL_WARM
+from app.ollama_client.client import OllamaClient
+from app.prompt_templates.manager import PromptTemplateManager
+
+logger = structlog.get_logger()
+
+WARMUP_TEXT = "Contato de teste: Maria Silva, telefone 11-9999-8888, apoio emocional"
+
+
+def in_business_hours(now: Optional[datetime] = None) -> bool:
+    """Check whether ``now`` (default: current time) is within business hours."""
+    now = now or datetime.now(ZoneInfo(settings.BUSINESS_TIMEZONE))
+    return (
+        now.weekday() in settings.BUSINESS_DAYS
+        and settings.BUSINESS_HOURS_START <= now.hour < settings.BUSINESS_HOURS_END
+    )
+
+
+class ModelWarmup:
+    """Warms the model up and keeps it resident; tracks readiness."""
+
+    def __init__(self, client: Optional[OllamaClient] = None):
+        self.client = client or OllamaClient()
+        self.ready = False
+        self.last_error: Optional[str] = None
+        self._tasks: list = []
+
+    async def warm_up(self) -> None:
+        """Load the model and run one generation; raises on failure."""
+        await self.client.load_model()
+        # Same system block as real extractions, so its prefix is cached too
+        templates = PromptTemplateManager()
+        await self.client.generate(
+            templates.render_entity_extraction(WARMUP_TEXT),
+            system=templates.render_entity_extraction_system(),
+        )
+        self.ready = True
+        self.last_error = None
+        MODEL_WARM.set(1)
+        logger.info("model_warm", model=self.client.model)
+
+    async def warm_up_until_ready(self) -> None:
+        """Retry the warm-up until it succeeds (Ollama may start after us)."""
+        while not self.ready:
+            try:
+                await self.warm_up()
+            except Exception as e:
+                self.last_error = str(e)
+                logger.warning("model_warmup_failed", error=str(e))
+                await asyncio.sleep(settings.WARMUP_RETRY_SECONDS)
+
+    async def keep_warm(self) -> None:
+        """Re-pin the model periodically during business hours."""
+        while True:
+            await asyncio.sleep(settings.KEEPER_INTERVAL_SECONDS)
+            if not self.ready or not in_business_hours():
+                continue
+            try:
+                await self.client.load_model()
+            except Exception as e:
+                logger.warning("model_keep_warm_failed", error=str(e))
+
+    def start(self) -> None:
+        """Start the warm-up and keeper tasks (readiness is immediate if disabled)."""
+        if not settings.WARMUP_ENABLED:
+            self.ready = True
+            return
+        self._tasks = [
+            asyncio.create_task(self.warm_up_until_ready()),
+            asyncio.create_task(self.keep_warm()),
+        ]
+
+    async def stop(self) -> None:
+        """Cancel the background tasks."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+
+warmup = ModelWarmup()
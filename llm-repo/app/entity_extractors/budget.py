@@ -0,0 +1,118 @@
+"""Per-request token budgets and input compaction for extraction.
+
+``num_predict`` caps the completion at the size of the JSON we expect, so a
+runaway generation stops after a few hundred tokens instead of running until
+the HTTP timeout. ``num_ctx`` is the smallest configured bucket that holds
+the prompt plus the completion. Buckets are deliberately coarse: Ollama
+reloads the model whenever ``num_ctx`` changes, so only a handful of sizes
+should ever be in use.
+"""
+
+import math
+import re
+from typing import Any, Dict
+
+from app.core.config import settings
+
+TRUNCATION_MARKER = " [...] "
+
+# Characters per llama3 token for Portuguese text; conservative so budgets
+# err on the large side
+CHARS_PER_TOKEN = 3.0
+
+_WHITESPACE = re.compile(r"\s+")
+_GREETING = re.compile(
+    r"^\s*(?:ol[áa]|oi|bom dia|boa tarde|boa noite|prezad[oa]s?|"
+    r"caro|cara|car[oa]s)\b[\s,.!:;-]*",
+    re.IGNORECASE,
+)
+# Closing phrases are dropped but whatever follows them (often the sender's
+# name) is kept, it may be an entity
+_CLOSING = re.compile(
+    r"\s*\b(?:atenciosamente|att|abra[çc]os?|grat[oa]|"
+    r"obrigad[oa]|muito obrigad[oa]|desde j[áa] agrade[çc]o)\b[\s,.!:;-]*",
+    re.IGNORECASE,
+)
+_SIGNATURE = re.compile(
+    r"(?:\n--\s*\n.*|enviado do meu \w+.*|sent from my \w+.*)$",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of a text."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def compact_text(text: str, max_chars: int) -> str:
+    """Drop greetings, sign-offs and signatures, collapse whitespace, truncate.
+
+    Truncation keeps the beginning and the end of the text (contact details
+    often come last) around TRUNCATION_MARKER.
+    """
+    text = _SIGNATURE.sub("", text)
+    text = _GREETING.sub("", text, count=1)
+    text = _CLOSING.sub(" ", text)
+    text = _WHITESPACE.sub(" ", text).strip()
+
+    if len(text) > max_chars:
+        keep = max_chars - len(TRUNCATION_MARKER)
+        head = keep * 2 // 3
+        tail = text[len(text) - (keep - head) :]
+        text = text[:head].rstrip() + TRUNCATION_MARKER + tail.lstrip()
+    return text
+
+
+class TokenBudget:
+    """Budget chosen for one extraction request."""
+
+    def __init__(
+        self,
+        prompt_tokens: int,
+        num_predict: int,
+        num_ctx: int,
+        input_chars: int,
+        compacted_chars: int,
+        truncated: bool,
+    ):
+        self.prompt_tokens = prompt_tokens
+        self.num_predict = num_predict
+        self.num_ctx = num_ctx
+        self.input_chars = input_chars
+        self.compacted_chars = compacted_chars
+        self.truncated = truncated
+
+    def options(self) -> Dict[str, int]:
+        """Ollama options enforcing this budget."""
+        return {"num_predict": self.num_predict, "num_ctx": self.num_ctx}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Budget as reported in API responses."""
+        return {
+            "prompt_tokens": self.prompt_tokens,
+            "num_predict": self.num_predict,
+            "num_ctx": self.num_ctx,
+            "input_chars": self.input_chars,
+            "compacted_chars": self.compacted_chars,
+            "truncated": self.truncated,
+        }
+
+
+def plan_budget(system: str, prompt: str, text: str, compacted: str) -> TokenBudget:
+    """Choose num_predict and num_ctx for a rendered prompt.
+
+    ``text`` is the caller's input and ``compacted`` what was sent of it.
+    """
+    prompt_tokens = estimate_tokens(system) + estimate_tokens(prompt)
+    num_predict = settings.EXTRACTION_NUM_PREDICT
+    needed = prompt_tokens + num_predict
+    buckets = sorted(settings.NUM_CTX_BUCKETS)
+    num_ctx = next((b for b in buckets if b >= needed), buckets[-1])
+    return TokenBudget(
+        prompt_tokens=prompt_tokens,
+        num_predict=num_predict,
+        num_ctx=num_ctx,
+        input_chars=len(text),
+        compacted_chars=len(compacted),
+        truncated=TRUNCATION_MARKER in compacted and TRUNCATION_MARKER not in text,
+    )
@@ -2,16 +2,30 @@
 
 import json
 import re
+import time
 from typing import Dict, Any, Optional
 import structlog
 
 from app.ollama_client.client import OllamaClient
 from app.prompt_templates.manager import PromptTemplateManager
 from app.core.config import settings
+from app.core.metrics import LENGTH_LIMITED, PARSE_FAILURES, observe_prompt_template
+from app.entity_extractors.budget import TokenBudget, compact_text, plan_budget
 
 logger = structlog.get_logger()
 
 
+class ExtractionResult:
+    """Entities extracted from a text and how the request was made."""
+
+    def __init__(
+        self, entities: Dict[str, Any], budget: TokenBudget, template_version: str
+    ):
+        self.entities = entities
+        self.budget = budget
+        self.template_version = template_version
+
+
 class EntityExtractor:
     """Entity extraction engine using LLM."""
 
@@ -21,6 +35,10 @@ class EntityExtractor:
 
     async def extract_entities(self, text: str) -> Dict[str, Any]:
         """Extract entities from text using LLM."""
+        return (await self.extract(text)).entities
+
+    async def extract(self, text: str) -> ExtractionResult:
+        """Extract entities, reporting the token budget and template version."""
         logger.info("entity_extraction_start", text_preview=text[:50])
 
         # Validate input
@@ -30,22 +48,41 @@ class EntityExtractor:
         if len(text) > settings.MAX_TEXT_LENGTH:
             raise ValueError(f"Text too long (max {settings.MAX_TEXT_LENGTH} characters)")
 
-        # Generate prompt
-        prompt = self.template_manager.render_entity_extraction(text)
+        # Generate prompt: constant instructions as system, text last
+        compacted = compact_text(text, settings.COMPACT_MAX_CHARS)
+        rendered = self.template_manager.entity_extraction_prompt(compacted)
+        budget = plan_budget(rendered.system, rendered.prompt, text, compacted)
 
         try:
             # Call LLM
-            response = await self.ollama.generate(prompt)
+            start = time.perf_counter()
+            response = await self.ollama.generate(
+                rendered.prompt, system=rendered.system, options=budget.options()
+            )
+            elapsed = time.perf_counter() - start
             llm_response = response.get("response", "")
+            if response.get("done_reason") == "length":
+                LENGTH_LIMITED.inc()
+                logger.warning("llm_num_predict_exhausted", **budget.to_dict())
 
             # Parse response
-            entities = self._parse_entities(llm_response)
+            parsed = self._parse_json(llm_response)
+            observe_prompt_template(
+                rendered.variant, rendered.version, elapsed, response, parsed is not None
+            )
+            entities = parsed if parsed is not None else self._empty_entities()
 
             # Validate extracted entities
             validated_entities = self._validate_entities(entities)
 
-            logger.info("entity_extraction_success", entities=validated_entities)
-            return validated_entities
+            logger.info(
+                "entity_extraction_success",
+                entities=validated_entities,
+                template_version=rendered.template_version,
+            )
+            return ExtractionResult(
+                validated_entities, budget, rendered.template_version
+            )
 
         except Exception as e:
             logger.error("entity_extraction_failure", error=str(e))
@@ -53,17 +90,26 @@ class EntityExtractor:
 
     def _parse_entities(self, response: str) -> Dict[str, Any]:
         """Parse LLM response to extract entities."""
+        entities = self._parse_json(response)
+        return entities if entities is not None else self._empty_entities()
+
+    def _parse_json(self, response: str) -> Optional[Dict[str, Any]]:
+        """Extract the JSON object of an LLM response (None if there is none)."""
         # Try to extract JSON from response
         json_match = re.search(r"\{.*\}", response, re.DOTALL)
         if json_match:
             json_str = json_match.group(0)
             try:
-                entities = json.loads(json_str)
-                return entities
+                return json.loads(json_str)
             except json.JSONDecodeError:
+                PARSE_FAILURES.labels("invalid_json").inc()
                 logger.warning("llm_json_parse_failed", response=response[:200])
+        else:
+            PARSE_FAILURES.labels("no_json").inc()
+        return None
 
-        # Fallback: return empty entities
+    def _empty_entities(self) -> Dict[str, Any]:
+        """Fallback when the response holds no usable JSON."""
         return {
             "nome": None,
             "telefone": None,
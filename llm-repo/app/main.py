@@ -1,13 +1,29 @@
 """LLM Service main application."""
 
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.config import settings
+from app.core.metrics import PrometheusMiddleware, render_metrics
+from app.core.profiling import ProfilingMiddleware
+from app.core.debug import router as debug_router
 from app.mcp_server.router import router as mcp_router
 from app.core.health import router as health_router
+from app.core.warmup import warmup
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm the model up in the background; /health/ready waits for it."""
+    warmup.start()
+    yield
+    await warmup.stop()
+
 
 app = FastAPI(
+    lifespan=lifespan,
     title="Central de Acolhimento LLM Service",
     description="""
 ## 🤖 LLM Service para Central de Acolhimento
@@ -76,10 +92,13 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(ProfilingMiddleware)
+app.add_middleware(PrometheusMiddleware)
 
 # Include routers
 app.include_router(health_router, prefix="/health", tags=["health"])
 app.include_router(mcp_router, prefix="/mcp", tags=["mcp"])
+app.include_router(debug_router, tags=["debug"])
 
 
 @app.get("/")
@@ -95,3 +114,10 @@ async def root():
             "/mcp/models",
         ],
     }
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Expose Prometheus metrics."""
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
@@ -1,9 +1,13 @@
 """MCP Server implementation."""
 
-from fastapi import APIRouter, HTTPException
+import json
+
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
-from typing import Dict, Any, Optional, List
+from typing import AsyncIterator, Dict, Any, Optional, List, Tuple
 
+from app.core.config import settings
 from app.entity_extractors.extractor import EntityExtractor
 from app.validators.validator import DataValidator
 from app.ollama_client.client import OllamaClient
@@ -21,12 +25,24 @@ class ExtractRequest(BaseModel):
     text: str = Field(..., description="Text to extract entities from", max_length=2000)
 
 
+class TokenBudgetInfo(BaseModel):
+    """Token budget chosen for an extraction."""
+    prompt_tokens: int
+    num_predict: int
+    num_ctx: int
+    input_chars: int
+    compacted_chars: int
+    truncated: bool
+
+
 class ExtractResponse(BaseModel):
     """Response model for entity extraction."""
     entities: Dict[str, Any]
     confidence: float
     success: bool
     message: Optional[str] = None
+    budget: Optional[TokenBudgetInfo] = None
+    template_version: Optional[str] = None
 
 
 class ValidateRequest(BaseModel):
@@ -55,7 +71,8 @@ async def extract_entities(request: ExtractRequest):
     """Extract entities from text using LLM."""
     try:
         # Extract entities
-        entities = await extractor.extract_entities(request.text)
+        result = await extractor.extract(request.text)
+        entities = result.entities
         
         # Calculate confidence
         confidence = validator.validate_extraction_confidence(entities)
@@ -64,7 +81,9 @@ async def extract_entities(request: ExtractRequest):
             entities=entities,
             confidence=confidence,
             success=True,
-            message="Entities extracted successfully"
+            message="Entities extracted successfully",
+            budget=TokenBudgetInfo(**result.budget.to_dict()),
+            template_version=result.template_version,
         )
         
     except ValueError as e:
@@ -92,6 +111,70 @@ async def validate_data(request: ValidateRequest):
         raise HTTPException(status_code=500, detail=f"Validation failed: {str(e)}")
 
 
+INVALID_LINE_ERROR = "Linha deve conter um objeto JSON"
+
+
+async def _ndjson_lines(request: Request) -> AsyncIterator[Tuple[int, bytes]]:
+    """Yield (1-based line number, line) for the non-blank lines of the body."""
+    buffer = b""
+    number = 0
+    async for chunk in request.stream():
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            number += 1
+            if line.strip():
+                yield number, line
+    if buffer.strip():
+        yield number + 1, buffer
+
+
+def _validate_chunk(lines: List[Tuple[int, bytes]]) -> str:
+    """Validate a chunk of lines with one batch call; return NDJSON results."""
+    records: List[Dict[str, Any]] = []
+    positions: List[int] = []
+    output: List[Dict[str, Any]] = []
+    for number, line in lines:
+        try:
+            record = json.loads(line)
+        except ValueError:
+            record = None
+        if isinstance(record, dict):
+            positions.append(len(output))
+            records.append(record)
+        output.append(
+            {"line": number, "valid": False, "corrected_data": {}, "errors": [INVALID_LINE_ERROR]}
+        )
+
+    for position, (is_valid, corrected_data, errors) in zip(
+        positions, validator.validate_batch(records)
+    ):
+        output[position].update(valid=is_valid, corrected_data=corrected_data, errors=errors)
+    return "".join(json.dumps(item, ensure_ascii=False) + "\n" for item in output)
+
+
+@router.post("/validate/batch")
+async def validate_batch(request: Request):
+    """Validate a stream of records, one JSON object per line (NDJSON/JSONL).
+
+    Results are streamed back as NDJSON in input order, one per non-blank
+    input line and tagged with its line number; records are validated in
+    chunks of VALIDATE_BATCH_CHUNK_SIZE as the body arrives.
+    """
+
+    async def results() -> AsyncIterator[str]:
+        chunk: List[Tuple[int, bytes]] = []
+        async for numbered_line in _ndjson_lines(request):
+            chunk.append(numbered_line)
+            if len(chunk) >= settings.VALIDATE_BATCH_CHUNK_SIZE:
+                yield _validate_chunk(chunk)
+                chunk = []
+        if chunk:
+            yield _validate_chunk(chunk)
+
+    return StreamingResponse(results(), media_type="application/x-ndjson")
+
+
 @router.get("/models", response_model=ModelsResponse)
 async def list_models():
     """List available Ollama models."""
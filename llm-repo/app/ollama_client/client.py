@@ -2,10 +2,11 @@
 
 import httpx
 import structlog
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from app.core.config import settings
+from app.core.metrics import observe_llm_call, observe_prompt_eval
 
 logger = structlog.get_logger()
 
@@ -23,35 +24,57 @@ class OllamaClient:
         wait=wait_exponential(multiplier=1, min=1, max=10),
     )
     async def generate(
-        self, prompt: str, system: Optional[str] = None
+        self,
+        prompt: str,
+        system: Optional[str] = None,
+        context: Optional[List[int]] = None,
+        options: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
-        """Generate text using Ollama."""
+        """Generate text using Ollama.
+
+        ``system`` should hold the constant part of the prompt so requests
+        share a prefix that Ollama keeps evaluated between calls. ``context``
+        (the ``context`` of a previous response) continues that exchange.
+        ``options`` override the default sampling options and budget.
+        """
         logger.info("ollama_generate_start", model=self.model, prompt_preview=prompt[:50])
 
         payload = {
             "model": self.model,
             "prompt": prompt,
             "stream": False,
+            "keep_alive": settings.OLLAMA_KEEP_ALIVE,
             "options": {
                 "temperature": 0.1,
                 "top_p": 0.9,
-                "max_tokens": 1000,
+                "num_predict": settings.DEFAULT_NUM_PREDICT,
+                "num_ctx": min(settings.NUM_CTX_BUCKETS),
+                **(options or {}),
             },
         }
 
         if system:
             payload["system"] = system
+        if context:
+            payload["context"] = context
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/api/generate",
-                    json=payload,
+            with observe_llm_call("generate"):
+                async with httpx.AsyncClient(timeout=self.timeout) as client:
+                    response = await client.post(
+                        f"{self.base_url}/api/generate",
+                        json=payload,
+                    )
+                    response.raise_for_status()
+
+                    result = response.json()
+                observe_prompt_eval("generate", result)
+                logger.info(
+                    "ollama_generate_success",
+                    model=self.model,
+                    prompt_eval_count=result.get("prompt_eval_count"),
+                    prompt_eval_duration_ns=result.get("prompt_eval_duration"),
                 )
-                response.raise_for_status()
-
-                result = response.json()
-                logger.info("ollama_generate_success", model=self.model)
                 return result
 
         except Exception as e:
@@ -61,14 +84,31 @@ class OllamaClient:
     async def list_models(self) -> Dict[str, Any]:
         """List available models."""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(f"{self.base_url}/api/tags")
-                response.raise_for_status()
-                return response.json()
+            with observe_llm_call("list_models"):
+                async with httpx.AsyncClient(timeout=self.timeout) as client:
+                    response = await client.get(f"{self.base_url}/api/tags")
+                    response.raise_for_status()
+                    return response.json()
         except Exception as e:
             logger.error("ollama_list_models_failure", error=str(e))
             raise
 
+    async def load_model(self, keep_alive: Optional[str] = None) -> Dict[str, Any]:
+        """Load the model into memory (or extend its keep_alive) without generating."""
+        # A generate request without a prompt only loads the model
+        payload = {
+            "model": self.model,
+            "keep_alive": keep_alive or settings.OLLAMA_KEEP_ALIVE,
+            # Load with the context size requests use, or the first request
+            # would reload the model
+            "options": {"num_ctx": min(settings.NUM_CTX_BUCKETS)},
+        }
+        with observe_llm_call("load_model"):
+            async with httpx.AsyncClient(timeout=self.timeout) as client:
+                response = await client.post(f"{self.base_url}/api/generate", json=payload)
+                response.raise_for_status()
+                return response.json()
+
     async def check_model(self, model: str = None) -> bool:
         """Check if model is available."""
         model = model or self.model
@@ -1,16 +1,68 @@
-"""Prompt templates for entity extraction."""
+"""Prompt templates for entity extraction.
 
-from jinja2 import Environment, FileSystemLoader
-from typing import Dict, Any
+All templates are compiled once, when the manager is created, and each gets
+a version: a short hash of its source, stable across processes and usable in
+cache keys. A template may have variants, ``<name>.<variant>.jinja2`` next
+to ``<name>.jinja2`` (the ``default`` variant); PROMPT_VARIANT_WEIGHTS picks
+between them per request so a cheaper prompt can be trialled on a share of
+the traffic and compared on the per-version metrics.
+"""
+
+import hashlib
 import os
+import random
+from typing import Any, Dict, Optional
+
+from jinja2 import Environment, FileSystemLoader, Template
 
 from app.core.config import settings
 
+TEMPLATE_SUFFIX = ".jinja2"
+DEFAULT_VARIANT = "default"
+
+
+def source_version(*sources: str) -> str:
+    """Short content hash identifying template source(s)."""
+    digest = hashlib.blake2b(digest_size=6)
+    for source in sources:
+        digest.update(source.encode("utf-8"))
+    return digest.hexdigest()
+
+
+class PromptTemplate:
+    """A compiled template with its content version."""
+
+    def __init__(self, name: str, variant: str, source: str, template: Template):
+        self.name = name
+        self.variant = variant
+        self.source = source
+        self.version = source_version(source)
+        self.template = template
+
+    def render(self, **context: Any) -> str:
+        """Render the template."""
+        return self.template.render(**context)
+
+
+class ExtractionPrompt:
+    """A rendered extraction prompt and the version that produced it."""
+
+    def __init__(self, system: str, prompt: str, variant: str, version: str):
+        self.system = system
+        self.prompt = prompt
+        self.variant = variant
+        self.version = version
+
+    @property
+    def template_version(self) -> str:
+        """``variant@version`` as reported with extraction results."""
+        return f"{self.variant}@{self.version}"
+
 
 class PromptTemplateManager:
-    """Manager for prompt templates."""
+    """Registry of compiled, versioned prompt templates."""
 
-    def __init__(self, template_path: str = None):
+    def __init__(self, template_path: str = None, rng: Optional[random.Random] = None):
         # Use absolute path for templates
         if template_path:
             self.template_path = template_path
@@ -18,23 +70,79 @@ class PromptTemplateManager:
             # Get the directory where this file is located
             current_dir = os.path.dirname(os.path.abspath(__file__))
             self.template_path = current_dir
-        
+
         self.env = Environment(
             loader=FileSystemLoader(self.template_path),
             trim_blocks=True,
             lstrip_blocks=True,
         )
+        self.rng = rng or random.Random()
+        self.templates: Dict[str, Dict[str, PromptTemplate]] = {}
+        self._compile_all()
+        self._rendered_system: Dict[str, str] = {}
+
+    def _compile_all(self) -> None:
+        for filename in self.env.list_templates(
+            filter_func=lambda f: f.endswith(TEMPLATE_SUFFIX)
+        ):
+            name, _, variant = filename[: -len(TEMPLATE_SUFFIX)].partition(".")
+            variant = variant or DEFAULT_VARIANT
+            source = self.env.loader.get_source(self.env, filename)[0]
+            compiled = self.env.get_template(filename)
+            self.templates.setdefault(name, {})[variant] = PromptTemplate(
+                name, variant, source, compiled
+            )
 
     def get_template(self, template_name: str) -> Any:
         """Get a template by name."""
         return self.env.get_template(template_name)
 
+    def variant(self, name: str, variant: str = DEFAULT_VARIANT) -> PromptTemplate:
+        """Get one variant of a template."""
+        return self.templates[name][variant]
+
+    def select(self, name: str) -> PromptTemplate:
+        """Pick a variant of a template according to PROMPT_VARIANT_WEIGHTS."""
+        variants = self.templates[name]
+        weights = settings.PROMPT_VARIANT_WEIGHTS.get(name)
+        if not weights:
+            return variants[DEFAULT_VARIANT]
+        candidates = [v for v in weights if v in variants and weights[v] > 0]
+        if not candidates:
+            return variants[DEFAULT_VARIANT]
+        chosen = self.rng.choices(candidates, [weights[v] for v in candidates])[0]
+        return variants[chosen]
+
+    def entity_extraction_prompt(self, text: str) -> ExtractionPrompt:
+        """Render an extraction prompt with a weighted choice of instructions."""
+        system = self.select("entity_extraction_system")
+        user = self.variant("entity_extraction")
+        return ExtractionPrompt(
+            system=self._render_system(system),
+            prompt=user.render(text=text),
+            variant=system.variant,
+            version=source_version(system.source, user.source),
+        )
+
+    def _render_system(self, template: PromptTemplate) -> str:
+        # System blocks take no variables: render each once
+        rendered = self._rendered_system.get(template.variant)
+        if rendered is None:
+            rendered = self._rendered_system[template.variant] = template.render()
+        return rendered
+
     def render_entity_extraction(self, text: str) -> str:
-        """Render entity extraction prompt."""
-        template = self.get_template("entity_extraction.jinja2")
-        return template.render(text=text)
+        """Render entity extraction prompt (the variable part, sent last)."""
+        return self.variant("entity_extraction").render(text=text)
+
+    def render_entity_extraction_system(self) -> str:
+        """Render the constant entity extraction instructions (default variant).
+
+        Sent as the ``system`` field so every request shares the same prompt
+        prefix and Ollama only evaluates the tokens of the input text.
+        """
+        return self._render_system(self.variant("entity_extraction_system"))
 
     def render_validation(self, data: Dict[str, Any]) -> str:
         """Render validation prompt."""
-        template = self.get_template("validation.jinja2")
-        return template.render(data=data)
+        return self.variant("validation").render(data=data)
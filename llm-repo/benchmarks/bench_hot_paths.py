@@ -0,0 +1,103 @@
+"""Benchmarks for the LLM service's pure-Python hot paths."""
+
+from benchmarks.runner import benchmark
+
+# Shapes llama3:8b actually returns: bare JSON, fenced JSON, JSON with prose
+LLM_OUTPUTS = [
+    '{"nome": "Maria Silva", "telefone": "11-99999-8888", '
+    '"email": "maria@example.com", "motivo": "apoio emocional", "data": null}',
+    'Aqui está o JSON extraído:\n```json\n{\n  "nome": "João Pereira",\n'
+    '  "telefone": "(21) 98888-7777",\n  "email": null,\n'
+    '  "motivo": "orientação jurídica",\n  "data": "2024-03-15"\n}\n```\n',
+    'Claro! {"nome": "Ana", "telefone": "1133334444", "email": "ANA@EXAMPLE.COM ",'
+    ' "motivo": "apoio psicológico", "data": null} Espero ter ajudado.',
+]
+
+CONTACTS = [
+    {
+        "nome": "Maria Silva",
+        "telefone": "(11) 99999-8888",
+        "email": "Maria@Example.com",
+        "motivo": "apoio emocional",
+        "data": "2024-01-15",
+    },
+    {"nome": "J", "telefone": "123", "email": "invalido", "motivo": "ok"},
+]
+
+PHONES = ["(11) 99999-8888", "11 3333 4444", "+55 21 98888-7777", "invalid"]
+
+TEXT = (
+    "Bom dia, aqui é a Maria Silva, meu telefone é (11) 99999-8888 e meu email "
+    "maria@example.com. Preciso de apoio emocional, estou passando por um "
+    "momento difícil desde a semana passada."
+)
+
+
+def _extractor():
+    from app.entity_extractors.extractor import EntityExtractor
+
+    return EntityExtractor()
+
+
+def _validator():
+    from app.validators.validator import DataValidator
+
+    return DataValidator()
+
+
+@benchmark("validator.validate_contact_data", number=5000)
+def bench_validate_contact_data():
+    validator = _validator()
+
+    def run():
+        for contact in CONTACTS:
+            validator.validate_contact_data(contact)
+
+    return run
+
+
+@benchmark("validator.validate_contact_data[1000]", number=20)
+def bench_validate_contact_data_loop():
+    validator = _validator()
+    records = CONTACTS * 500
+    return lambda: [validator.validate_contact_data(r) for r in records]
+
+
+@benchmark("validator.validate_batch[1000]", number=20)
+def bench_validate_batch():
+    validator = _validator()
+    records = CONTACTS * 500
+    return lambda: validator.validate_batch(records)
+
+
+@benchmark("validator.validate_extraction_confidence", number=20000)
+def bench_validate_extraction_confidence():
+    validator = _validator()
+    entities = CONTACTS[0]
+    return lambda: validator.validate_extraction_confidence(entities)
+
+
+@benchmark("validator._normalize_phone", number=20000)
+def bench_validator_normalize_phone():
+    normalize = _validator()._normalize_phone
+    return lambda: [normalize(p) for p in PHONES]
+
+
+@benchmark("extractor._normalize_phone", number=20000)
+def bench_extractor_normalize_phone():
+    normalize = _extractor()._normalize_phone
+    return lambda: [normalize(p) for p in PHONES]
+
+
+@benchmark("extractor._parse_entities", number=5000)
+def bench_parse_entities():
+    parse = _extractor()._parse_entities
+    return lambda: [parse(output) for output in LLM_OUTPUTS]
+
+
+@benchmark("prompts.render_entity_extraction", number=2000)
+def bench_render_entity_extraction():
+    from app.prompt_templates.manager import PromptTemplateManager
+
+    manager = PromptTemplateManager()
+    return lambda: manager.render_entity_extraction(TEXT)
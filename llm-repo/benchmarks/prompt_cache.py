@@ -0,0 +1,83 @@
+"""Measure prompt evaluation cost of the extraction prompt layouts.
+
+Sends the same texts to Ollama (or ``loadtest.ollama_simulator``) in two
+layouts and reports the mean ``prompt_eval_count`` / ``prompt_eval_duration``
+Ollama returns:
+
+* ``inline``: instructions and text in one prompt, text in the middle
+  (the layout used before the system block was split out);
+* ``system``: constant instructions in ``system``, text at the end.
+
+Usage (from the service directory, Ollama running)::
+
+    python -m benchmarks.prompt_cache --requests 20
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+from typing import Dict, List, Optional
+
+from app.ollama_client.client import OllamaClient
+from app.prompt_templates.manager import PromptTemplateManager
+
+TEXTS = [
+    "Bom dia, sou a Maria Silva, telefone 11-99999-8888, preciso de apoio emocional.",
+    "Meu nome é João Pereira, (21) 98888-7777, joao@example.com, orientação jurídica.",
+    "Aqui é Ana Souza, 11 3333-4444, gostaria de apoio psicológico para minha filha.",
+    "Carlos Lima, fone 31988887777, email carlos@example.com, assistência social.",
+]
+
+
+def inline_prompt(system: str, text: str) -> str:
+    """Rebuild the old single-prompt layout with the text mid-instructions."""
+    head, _, tail = system.partition("Instruções:")
+    return f"{head}Texto de entrada:\n{text}\n\nInstruções:{tail}"
+
+
+async def measure(layout: str, requests: int) -> Dict[str, float]:
+    """Run ``requests`` extractions in one layout; first (cold) one excluded."""
+    client = OllamaClient()
+    templates = PromptTemplateManager()
+    system = templates.render_entity_extraction_system()
+    counts: List[int] = []
+    durations: List[float] = []
+    for i in range(requests + 1):
+        text = TEXTS[i % len(TEXTS)]
+        if layout == "inline":
+            result = await client.generate(inline_prompt(system, text))
+        else:
+            result = await client.generate(
+                templates.render_entity_extraction(text), system=system
+            )
+        if i == 0:
+            continue
+        counts.append(result.get("prompt_eval_count", 0))
+        durations.append(result.get("prompt_eval_duration", 0) / 1e6)
+    return {
+        "prompt_eval_count": statistics.mean(counts),
+        "prompt_eval_ms": statistics.mean(durations),
+    }
+
+
+async def _main(requests: int) -> None:
+    for layout in ("inline", "system"):
+        result = await measure(layout, requests)
+        print(  # noqa: T201
+            f"{layout:<8} prompt_eval_count={result['prompt_eval_count']:7.1f} "
+            f"prompt_eval={result['prompt_eval_ms']:8.1f}ms"
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20)
+    args = parser.parse_args(argv)
+    asyncio.run(_main(args.requests))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
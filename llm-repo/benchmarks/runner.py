@@ -0,0 +1,132 @@
+"""Minimal microbenchmark runner with baseline comparison.
+
+Usage (from the service directory)::
+
+    python -m benchmarks.runner                          # run, print table
+    python -m benchmarks.runner --output results.json    # also write JSON
+    python -m benchmarks.runner --save-baseline benchmarks/baseline.json
+    python -m benchmarks.runner --baseline benchmarks/baseline.json --threshold 0.15
+
+With ``--baseline`` the process exits with status 1 when any benchmark's
+median is more than ``threshold`` slower than the stored baseline.
+Baselines are machine specific: record them on the machine (or CI runner
+class) that runs the comparison.
+"""
+
+import argparse
+import gc
+import importlib
+import json
+import platform
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+
+# name -> (setup returning the callable to time, calls per round, rounds)
+BENCHMARKS: Dict[str, tuple] = {}
+
+MODULES = ["benchmarks.bench_hot_paths"]
+
+
+def benchmark(name: str, number: int = 1000, rounds: int = 7) -> Callable:
+    """Register a setup function; it returns the zero-argument callable to time."""
+
+    def decorator(setup: Callable[[], Callable[[], object]]) -> Callable:
+        BENCHMARKS[name] = (setup, number, rounds)
+        return setup
+
+    return decorator
+
+
+def run(selected: Optional[List[str]] = None) -> Dict[str, dict]:
+    """Run the registered benchmarks; times are seconds per call."""
+    for module in MODULES:
+        importlib.import_module(module)
+
+    results = {}
+    for name, (setup, number, rounds) in BENCHMARKS.items():
+        if selected and not any(s in name for s in selected):
+            continue
+        func = setup()
+        func()  # warm-up (imports, caches)
+        timings = []
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            for _ in range(rounds):
+                start = time.perf_counter()
+                for _ in range(number):
+                    func()
+                timings.append((time.perf_counter() - start) / number)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        results[name] = {
+            "median": statistics.median(timings),
+            "min": min(timings),
+            "max": max(timings),
+            "number": number,
+            "rounds": rounds,
+        }
+    return results
+
+
+def compare(
+    results: Dict[str, dict], baseline: Dict[str, dict], threshold: float
+) -> List[str]:
+    """List benchmarks whose median regressed by more than ``threshold``."""
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        ratio = result["median"] / base["median"]
+        if ratio > 1 + threshold:
+            regressions.append(
+                f"{name}: {base['median'] * 1e6:.1f}us -> "
+                f"{result['median'] * 1e6:.1f}us ({(ratio - 1) * 100:+.0f}%)"
+            )
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-k", dest="selected", action="append", help="name filter")
+    parser.add_argument("--output", help="write results JSON here")
+    parser.add_argument("--baseline", help="compare against this results JSON")
+    parser.add_argument("--save-baseline", help="write results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.15)
+    args = parser.parse_args(argv)
+
+    results = run(args.selected)
+    for name, result in results.items():
+        print(f"{name:<48} {result['median'] * 1e6:>12.2f} us/call")  # noqa: T201
+
+    document = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "benchmarks": results,
+    }
+    for path in filter(None, [args.output, args.save_baseline]):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(document, f, indent=2, sort_keys=True)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["benchmarks"]
+        regressions = compare(results, baseline, args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}")  # noqa: T201
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    # Run through the importable module so benchmark modules register into
+    # the same BENCHMARKS dict (not this __main__ copy).
+    from benchmarks import runner
+
+    sys.exit(runner.main())
@@ -0,0 +1,78 @@
+"""Unit tests for extraction token budgets."""
+
+from unittest.mock import patch
+
+import pytest
+
+from app.core.config import settings
+from app.entity_extractors.budget import (
+    TRUNCATION_MARKER,
+    compact_text,
+    estimate_tokens,
+    plan_budget,
+)
+
+
+def test_compact_text_drops_greeting_and_closing():
+    """Test greetings and sign-offs go, the sender's name stays."""
+    text = "Bom dia!\n\n  Preciso de   apoio emocional.\nAtenciosamente,\nMaria Silva"
+
+    assert compact_text(text, 1500) == "Preciso de apoio emocional. Maria Silva"
+
+
+def test_compact_text_drops_signature():
+    """Test mail signatures after '--' and mobile footers are removed."""
+    text = "Telefone 11-9999-8888\n--\nEmpresa X\nRua Y, 123"
+
+    assert compact_text(text, 1500) == "Telefone 11-9999-8888"
+    assert compact_text("Oi, sou Ana. Enviado do meu iPhone", 1500) == "sou Ana."
+
+
+def test_compact_text_truncates_keeping_head_and_tail():
+    """Test long texts keep both ends around the marker."""
+    text = "inicio " + "x" * 3000 + " telefone 11-9999-8888"
+
+    compacted = compact_text(text, 300)
+
+    assert len(compacted) <= 300
+    assert TRUNCATION_MARKER in compacted
+    assert compacted.startswith("inicio")
+    assert compacted.endswith("11-9999-8888")
+
+
+def test_plan_budget_picks_smallest_fitting_context():
+    """Test num_ctx is the smallest bucket holding prompt + completion."""
+    with patch.object(settings, "NUM_CTX_BUCKETS", [2048, 4096]):
+        small = plan_budget("s" * 300, "p" * 300, "t", "t")
+        large = plan_budget("s" * 300, "p" * 6000, "t", "t")
+
+    assert small.num_ctx == 2048
+    assert small.num_predict == settings.EXTRACTION_NUM_PREDICT
+    assert small.prompt_tokens == estimate_tokens("s" * 300) + estimate_tokens("p" * 300)
+    assert large.num_ctx == 4096
+
+
+def test_plan_budget_reports_truncation():
+    """Test the budget flags inputs that were truncated."""
+    budget = plan_budget("s", "p", "x" * 2000, "x" * 10 + TRUNCATION_MARKER + "x")
+
+    assert budget.truncated is True
+    assert budget.to_dict()["input_chars"] == 2000
+    assert budget.options() == {
+        "num_predict": budget.num_predict,
+        "num_ctx": budget.num_ctx,
+    }
+
+
+@pytest.mark.asyncio
+async def test_extraction_sends_budget_options(
+    entity_extractor, sample_text, sample_llm_response
+):
+    """Test the extractor sends num_predict/num_ctx and returns the budget."""
+    with patch.object(
+        entity_extractor.ollama, "generate", return_value=sample_llm_response
+    ) as generate:
+        result = await entity_extractor.extract(sample_text)
+
+    assert generate.call_args.kwargs["options"] == result.budget.options()
+    assert "max_tokens" not in generate.call_args.kwargs["options"]
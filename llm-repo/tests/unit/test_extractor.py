@@ -55,3 +55,20 @@ def test_parse_entities_invalid_json(entity_extractor):
     
     assert result["nome"] is None
     assert result["telefone"] is None
+
+
+@pytest.mark.asyncio
+async def test_extract_entities_sends_instructions_as_system(
+    entity_extractor, sample_text, sample_llm_response
+):
+    """Test the constant instructions go in system and the text comes last."""
+    with patch.object(
+        entity_extractor.ollama, "generate", return_value=sample_llm_response
+    ) as generate:
+        await entity_extractor.extract_entities(sample_text)
+
+    prompt = generate.call_args.args[0]
+    system = generate.call_args.kwargs["system"]
+    assert prompt.rstrip().endswith(sample_text)
+    assert sample_text not in system
+    assert system == entity_extractor.template_manager.render_entity_extraction_system()
@@ -0,0 +1,51 @@
+"""Unit tests for Prometheus metrics."""
+
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from app.core.metrics import observe_prompt_eval
+from app.main import app
+
+
+def _sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+def test_metrics_endpoint():
+    """Test /metrics serves the Prometheus exposition format."""
+    client = TestClient(app)
+    client.get("/health/")
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert 'route="/health/"' in response.text
+
+
+def test_validation_failures_are_counted_per_field(data_validator):
+    """Test DataValidator counts failures by field."""
+    before = _sample("validation_failures_total", field="nome")
+
+    data_validator.validate_contact_data({"nome": "A", "telefone": "11-9999-8888"})
+
+    assert _sample("validation_failures_total", field="nome") == before + 1
+
+
+def test_parse_failures_are_counted(entity_extractor):
+    """Test EntityExtractor counts responses without JSON."""
+    before = _sample("llm_parse_failures_total", reason="no_json")
+
+    entity_extractor._parse_entities("sem json aqui")
+
+    assert _sample("llm_parse_failures_total", reason="no_json") == before + 1
+
+
+def test_prompt_eval_is_recorded():
+    """Test prompt_eval_count/duration of Ollama responses are observed."""
+    before = _sample("llm_prompt_eval_tokens_sum", operation="generate")
+
+    observe_prompt_eval(
+        "generate", {"prompt_eval_count": 42, "prompt_eval_duration": 30_000_000}
+    )
+
+    assert _sample("llm_prompt_eval_tokens_sum", operation="generate") == before + 42
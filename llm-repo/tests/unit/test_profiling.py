@@ -0,0 +1,39 @@
+"""Unit tests for request profiling."""
+
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.core.profiling import CaptureStore, collapse
+from app.main import app
+
+
+def test_collapse_folds_stack_root_first():
+    """Test stacks are folded root-first into a single line."""
+    import sys
+
+    line = collapse(sys._getframe())
+
+    assert line.split(";")[-1].startswith("test_collapse_folds_stack_root_first")
+
+
+def test_capture_store_is_bounded(tmp_path):
+    """Test the oldest captures are evicted beyond the limit."""
+    store = CaptureStore(str(tmp_path), max_captures=1)
+
+    store.save("POST-/mcp/extract", ["a;b 1"])
+    newest = store.save("POST-/mcp/extract", ["a;c 2"])
+
+    assert [c["name"] for c in store.list()] == [newest]
+
+
+def test_profile_endpoints_require_token(tmp_path, monkeypatch):
+    """Test captures are served only with the debug token."""
+    monkeypatch.setattr(settings, "PROFILE_TOKEN", "secret")
+    monkeypatch.setattr(settings, "PROFILE_DIR", str(tmp_path))
+    name = CaptureStore(str(tmp_path), 5).save("POST-/mcp/extract", ["main 1"])
+    client = TestClient(app)
+
+    assert client.get("/debug/profiles").status_code == 404
+    response = client.get(f"/debug/profiles/{name}", headers={"X-Profile": "secret"})
+
+    assert response.text == "main 1\n"
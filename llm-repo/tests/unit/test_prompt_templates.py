@@ -0,0 +1,82 @@
+"""Unit tests for the prompt template registry."""
+
+import random
+from unittest.mock import patch
+
+import pytest
+
+from app.core.config import settings
+from app.prompt_templates.manager import PromptTemplateManager, source_version
+
+
+def test_templates_compiled_with_content_versions():
+    """Test every template is compiled up front with a source hash version."""
+    manager = PromptTemplateManager()
+
+    system = manager.variant("entity_extraction_system")
+    compact = manager.variant("entity_extraction_system", "compact")
+
+    assert set(manager.templates) >= {
+        "entity_extraction",
+        "entity_extraction_system",
+        "validation",
+    }
+    assert system.version == source_version(system.source)
+    assert compact.version != system.version
+    assert PromptTemplateManager().variant("entity_extraction_system").version == (
+        system.version
+    )
+
+
+def test_select_defaults_without_weights():
+    """Test the default variant is used unless weights are configured."""
+    manager = PromptTemplateManager()
+
+    with patch.object(settings, "PROMPT_VARIANT_WEIGHTS", {}):
+        chosen = {manager.select("entity_extraction_system").variant for _ in range(20)}
+
+    assert chosen == {"default"}
+
+
+def test_select_follows_weights():
+    """Test weighted selection between variants."""
+    manager = PromptTemplateManager(rng=random.Random(7))
+    weights = {"entity_extraction_system": {"default": 1, "compact": 3}}
+
+    with patch.object(settings, "PROMPT_VARIANT_WEIGHTS", weights):
+        picks = [manager.select("entity_extraction_system").variant for _ in range(400)]
+
+    assert 0.65 < picks.count("compact") / len(picks) < 0.85
+
+
+def test_entity_extraction_prompt_reports_version():
+    """Test rendered prompts carry the variant and version that built them."""
+    manager = PromptTemplateManager()
+
+    rendered = manager.entity_extraction_prompt("Maria, 11-9999-8888")
+
+    assert rendered.prompt.rstrip().endswith("Maria, 11-9999-8888")
+    assert rendered.system == manager.render_entity_extraction_system()
+    assert rendered.template_version == f"default@{rendered.version}"
+
+
+@pytest.mark.asyncio
+async def test_extract_reports_template_version_and_metrics(
+    entity_extractor, sample_text, sample_llm_response
+):
+    """Test extraction results and metrics are tagged with the template version."""
+    from prometheus_client import REGISTRY
+
+    rendered = entity_extractor.template_manager.entity_extraction_prompt(sample_text)
+    labels = {"variant": "default", "version": rendered.version, "outcome": "success"}
+    before = REGISTRY.get_sample_value("prompt_template_parses_total", labels) or 0
+
+    with patch.object(
+        entity_extractor.ollama, "generate", return_value=sample_llm_response
+    ):
+        result = await entity_extractor.extract(sample_text)
+
+    assert result.template_version == rendered.template_version
+    assert REGISTRY.get_sample_value("prompt_template_parses_total", labels) == (
+        before + 1
+    )
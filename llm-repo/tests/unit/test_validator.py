@@ -44,3 +44,68 @@ def test_normalize_phone(data_validator):
     assert data_validator._normalize_phone("(11) 9999-8888") == "11-9999-8888"
     assert data_validator._normalize_phone("11 9999 8888") == "11-9999-8888"
     assert data_validator._normalize_phone("1199998888") == "11-9999-8888"
+
+
+BATCH_RECORDS = [
+    {
+        "nome": "  Maria Silva ",
+        "telefone": "(11) 99999-8888",
+        "email": " Maria@Example.com ",
+        "motivo": "apoio emocional",
+        "data": "2024-01-15",
+    },
+    {"nome": "A", "telefone": "invalid", "email": "invalid-email", "motivo": "OK"},
+    {"nome": "João", "telefone": None, "motivo": "orientação", "data": "15/01/2024"},
+    {"nome": "Ana", "telefone": "11 3333 4444", "email": "a@b.com\nx@y.com", "motivo": "ajuda"},
+    {"nome": 42, "telefone": 1133334444, "email": "", "motivo": None, "data": " "},
+    {},
+]
+
+
+def test_validate_batch_matches_single(data_validator):
+    """Test validate_batch gives exactly the per-record results."""
+    expected = [data_validator.validate_contact_data(r) for r in BATCH_RECORDS]
+
+    assert data_validator.validate_batch(BATCH_RECORDS) == expected
+    assert data_validator.validate_batch([]) == []
+
+
+def test_validate_batch_counts_failures(data_validator):
+    """Test batch validation counts the same failures as single validation."""
+    from app.core.metrics import VALIDATION_FAILURES
+
+    before = VALIDATION_FAILURES.labels("telefone")._value.get()
+    data_validator.validate_batch(BATCH_RECORDS)
+
+    assert VALIDATION_FAILURES.labels("telefone")._value.get() - before == 4
+
+
+def test_validate_batch_endpoint_streams_ndjson():
+    """Test /mcp/validate/batch validates NDJSON lines and streams results."""
+    import json
+    from unittest.mock import patch
+
+    from fastapi.testclient import TestClient
+
+    from app.core.config import settings
+    from app.main import app
+
+    body = "\n".join(json.dumps(r) for r in BATCH_RECORDS[:2]) + "\n\nnot json\n[1]"
+
+    with patch.object(settings, "VALIDATE_BATCH_CHUNK_SIZE", 1):
+        response = TestClient(app).post(
+            "/mcp/validate/batch",
+            content=body,
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    results = [json.loads(line) for line in response.text.splitlines()]
+    assert [r["line"] for r in results] == [1, 2, 4, 5]
+    assert results[0]["valid"] is True
+    assert results[0]["corrected_data"]["telefone"] == "11-99999-8888"
+    assert results[1]["valid"] is False
+    assert "Nome deve ter pelo menos 2 caracteres" in results[1]["errors"]
+    assert results[2]["errors"] == ["Linha deve conter um objeto JSON"]
+    assert results[3]["valid"] is False
@@ -0,0 +1,134 @@
+"""Unit tests for model warm-up and readiness."""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.core.warmup import ModelWarmup, in_business_hours, warmup
+from app.main import app
+from app.ollama_client.client import OllamaClient
+
+
+def test_in_business_hours():
+    """Test business hours follow the configured days and hours."""
+    wednesday_noon = datetime(2024, 1, 10, 12, 0)
+    wednesday_night = datetime(2024, 1, 10, 23, 30)
+    sunday_noon = datetime(2024, 1, 14, 12, 0)
+
+    assert in_business_hours(wednesday_noon) is True
+    assert in_business_hours(wednesday_night) is False
+    assert in_business_hours(sunday_noon) is False
+
+
+@pytest.mark.asyncio
+async def test_warm_up_loads_model_and_generates():
+    """Test warm-up loads the model, runs a generation and becomes ready."""
+    client = MagicMock(model="llama3:8b")
+    client.load_model = AsyncMock()
+    client.generate = AsyncMock(return_value={"response": "{}"})
+    model_warmup = ModelWarmup(client)
+
+    await model_warmup.warm_up()
+
+    client.load_model.assert_awaited_once()
+    client.generate.assert_awaited_once()
+    assert model_warmup.ready is True
+
+
+@pytest.mark.asyncio
+async def test_warm_up_until_ready_retries():
+    """Test warm-up is retried until Ollama answers."""
+    client = MagicMock(model="llama3:8b")
+    client.load_model = AsyncMock(side_effect=[Exception("connection refused"), {}])
+    client.generate = AsyncMock(return_value={"response": "{}"})
+    model_warmup = ModelWarmup(client)
+
+    with patch.object(settings, "WARMUP_RETRY_SECONDS", 0):
+        await model_warmup.warm_up_until_ready()
+
+    assert client.load_model.await_count == 2
+    assert model_warmup.ready is True
+    assert model_warmup.last_error is None
+
+
+def test_warmup_disabled_is_ready_immediately():
+    """Test readiness does not wait when warm-up is disabled."""
+    model_warmup = ModelWarmup(MagicMock())
+
+    with patch.object(settings, "WARMUP_ENABLED", False):
+        model_warmup.start()
+
+    assert model_warmup.ready is True
+
+
+def test_readiness_gated_on_warmup():
+    """Test /health/ready returns 503 until the model is warm."""
+    client = TestClient(app)
+
+    with patch.object(warmup, "ready", False):
+        cold = client.get("/health/ready")
+    with patch.object(warmup, "ready", True):
+        warm = client.get("/health/ready")
+
+    assert cold.status_code == 503
+    assert cold.json()["status"] == "warming_up"
+    assert warm.status_code == 200
+    assert warm.json()["status"] == "ready"
+
+
+@pytest.mark.asyncio
+async def test_generate_sends_keep_alive():
+    """Test every generate request carries keep_alive."""
+    with patch("httpx.AsyncClient.post") as mock_post:
+        mock_post.return_value = MagicMock(json=lambda: {"response": "ok"})
+
+        await OllamaClient().generate("prompt")
+
+    payload = mock_post.call_args.kwargs["json"]
+    assert payload["keep_alive"] == settings.OLLAMA_KEEP_ALIVE
+
+
+@pytest.mark.asyncio
+async def test_load_model_sends_no_prompt():
+    """Test load_model only loads the model (no prompt, keep_alive set)."""
+    with patch("httpx.AsyncClient.post") as mock_post:
+        mock_post.return_value = MagicMock(json=lambda: {"done": True})
+
+        await OllamaClient().load_model(keep_alive="1h")
+
+    payload = mock_post.call_args.kwargs["json"]
+    assert "prompt" not in payload
+    assert payload["keep_alive"] == "1h"
+
+
+@pytest.mark.asyncio
+async def test_keep_warm_pins_model_in_business_hours():
+    """Test the keeper re-pins the model only during business hours."""
+    client = MagicMock(model="llama3:8b")
+    client.load_model = AsyncMock()
+    model_warmup = ModelWarmup(client)
+    model_warmup.ready = True
+    sleeps = AsyncMock(side_effect=[None, None, StopAsyncIteration])
+
+    with patch("app.core.warmup.asyncio.sleep", sleeps), patch(
+        "app.core.warmup.in_business_hours", side_effect=[True, False]
+    ):
+        with pytest.raises(StopAsyncIteration):
+            await model_warmup.keep_warm()
+
+    client.load_model.assert_awaited_once()
+
+
+def test_lifespan_starts_and_stops_warmup():
+    """Test the app lifespan runs warm-up in the background and cancels it."""
+    with patch.object(warmup, "warm_up_until_ready", AsyncMock()) as warm, patch.object(
+        warmup, "keep_warm", AsyncMock()
+    ):
+        with TestClient(app):
+            pass
+
+    warm.assert_awaited_once()
+    assert warmup._tasks == []
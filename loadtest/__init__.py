@@ -0,0 +1 @@
+"""End-to-end load testing against a simulated Ollama."""
@@ -0,0 +1,253 @@
+"""Local stand-in for Ollama with a configurable performance profile.
+
+Serves the subset of the Ollama HTTP API the services use (``/api/generate``
+streaming and non-streaming, ``/api/tags``) and answers extraction prompts
+with realistic JSON completions built from the input text, so the API and
+the LLM service can be load tested without a GPU or a real llama3:8b.
+
+Run it on Ollama's port and point both services at it::
+
+    SIM_TOKENS_PER_SEC=30 SIM_SLOTS=1 uvicorn loadtest.ollama_simulator:app --port 11434
+
+Behaviour is set through environment variables (read at import):
+
+``SIM_MODELS``               comma-separated model names (``llama3:8b``)
+``SIM_SLOTS``                concurrent generations, like OLLAMA_NUM_PARALLEL (1)
+``SIM_TTFT_MS``              median time to first token (prompt eval) (350)
+``SIM_TTFT_SIGMA``           log-normal sigma of the TTFT distribution (0.35)
+``SIM_TOKENS_PER_SEC``       decode rate for the completion (35)
+``SIM_PROMPT_TOKENS_PER_SEC`` prompt eval rate added to the TTFT (1500)
+``SIM_ERROR_RATE``           fraction of generations answered with HTTP 500 (0)
+``SIM_GARBAGE_RATE``         fraction of completions that are not JSON (0.02)
+``SIM_SEED``                 random seed for reproducible runs (unset)
+
+Requests beyond ``SIM_SLOTS`` wait for a slot, as they do on a real Ollama,
+so queueing shows up in client-side latency. Like Ollama, the prefix a
+prompt shares with the previous one (``system`` first, then ``prompt``) is
+treated as cached: ``prompt_eval_count`` and the prompt eval time only cover
+the remaining tokens.
+"""
+
+import asyncio
+import json
+import os
+import random
+import re
+import time
+import zlib
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel
+
+
+def _env(name: str, default: str) -> str:
+    return os.environ.get(name, default)
+
+
+class SimulatorConfig:
+    """Performance profile of the simulated model server."""
+
+    def __init__(self) -> None:
+        self.models = [m.strip() for m in _env("SIM_MODELS", "llama3:8b").split(",")]
+        self.slots = int(_env("SIM_SLOTS", "1"))
+        self.ttft_ms = float(_env("SIM_TTFT_MS", "350"))
+        self.ttft_sigma = float(_env("SIM_TTFT_SIGMA", "0.35"))
+        self.tokens_per_sec = float(_env("SIM_TOKENS_PER_SEC", "35"))
+        self.prompt_tokens_per_sec = float(_env("SIM_PROMPT_TOKENS_PER_SEC", "1500"))
+        self.error_rate = float(_env("SIM_ERROR_RATE", "0"))
+        self.garbage_rate = float(_env("SIM_GARBAGE_RATE", "0.02"))
+        seed = os.environ.get("SIM_SEED")
+        self.random = random.Random(int(seed) if seed else None)
+
+
+config = SimulatorConfig()
+_slots = asyncio.Semaphore(config.slots)
+
+app = FastAPI(title="Ollama simulator")
+
+
+class GenerateRequest(BaseModel):
+    """Body of /api/generate (unknown fields are ignored)."""
+
+    model: str
+    prompt: str = ""
+    system: Optional[str] = None
+    stream: bool = True
+    options: Dict = {}
+    context: Optional[List[int]] = None
+    keep_alive: Optional[object] = None
+
+
+_PHONE = re.compile(r"\(?\b(\d{2})\)?[\s.-]*(9?\d{4})[\s.-]*(\d{4})\b")
+_EMAIL = re.compile(r"[\w.+-]+@[\w-]+\.[\w.]+")
+_UPPER, _LOWER = "A-ZÁÉÍÓÚÂÊÔÃÕÇ", "a-záéíóúâêôãõç"
+_NAME = re.compile(rf"\b([{_UPPER}][{_LOWER}]+(?: [{_UPPER}][{_LOWER}]+)+)")
+_DATE = re.compile(r"\b(\d{4}-\d{2}-\d{2})\b")
+_MOTIVOS = (
+    "apoio emocional",
+    "orientação jurídica",
+    "apoio psicológico",
+    "assistência social",
+    "violência doméstica",
+)
+_INPUT_MARKER = "Texto de entrada:"
+_last_prompt = ""
+
+
+def count_tokens(text: str) -> int:
+    """Approximate llama3 token count (~4 characters per token)."""
+    return max(1, len(text) // 4)
+
+
+def uncached_tokens(full_prompt: str) -> int:
+    """Tokens of a prompt not covered by the previous prompt's prefix."""
+    global _last_prompt
+    shared = len(os.path.commonprefix([full_prompt, _last_prompt]))
+    _last_prompt = full_prompt
+    return max(1, count_tokens(full_prompt) - shared // 4)
+
+
+def input_text(prompt: str) -> str:
+    """Extract the user text from an extraction prompt."""
+    if _INPUT_MARKER not in prompt:
+        return prompt
+    tail = prompt.split(_INPUT_MARKER, 1)[1]
+    return tail.split("\n\n", 1)[0].strip() or tail
+
+
+def complete(prompt: str) -> str:
+    """Build a completion for a prompt, JSON for extraction prompts."""
+    if config.random.random() < config.garbage_rate:
+        return "Desculpe, não consegui identificar os dados solicitados no texto."
+
+    text = input_text(prompt)
+    phone = _PHONE.search(text)
+    email = _EMAIL.search(text)
+    name = _NAME.search(text)
+    date = _DATE.search(text)
+    motivo = next((m for m in _MOTIVOS if m in text.lower()), None)
+    entities = {
+        "nome": name.group(1) if name else None,
+        "telefone": "-".join(phone.groups()) if phone else None,
+        "email": email.group(0) if email else None,
+        "motivo": motivo or ("apoio emocional" if text else None),
+        "data": date.group(1) if date else None,
+    }
+    return json.dumps(entities, ensure_ascii=False, indent=2)
+
+
+def _tokens(completion: str) -> List[str]:
+    """Split a completion into ~4-character pseudo tokens."""
+    return [completion[i : i + 4] for i in range(0, len(completion), 4)] or [""]
+
+
+def _timings(prompt_tokens: int) -> Tuple[float, float]:
+    """Sample (time to first token, prompt eval time) in seconds."""
+    ttft = config.random.lognormvariate(0, config.ttft_sigma) * config.ttft_ms / 1000
+    prompt_eval = prompt_tokens / config.prompt_tokens_per_sec
+    return ttft, prompt_eval
+
+
+def _final(
+    model: str,
+    prompt_tokens: int,
+    eval_tokens: int,
+    prompt_eval: float,
+    eval_time: float,
+    started: float,
+) -> Dict:
+    ns = 1_000_000_000
+    return {
+        "model": model,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "done": True,
+        "done_reason": "stop",
+        "context": list(range(prompt_tokens + eval_tokens))[:64],
+        "total_duration": int((time.perf_counter() - started) * ns),
+        "load_duration": 0,
+        "prompt_eval_count": prompt_tokens,
+        "prompt_eval_duration": int(prompt_eval * ns),
+        "eval_count": eval_tokens,
+        "eval_duration": int(eval_time * ns),
+    }
+
+
+def _error(message: str, status: int = 500) -> JSONResponse:
+    return JSONResponse(status_code=status, content={"error": message})
+
+
+@app.get("/api/tags")
+async def tags() -> Dict:
+    """List the simulated models."""
+    return {
+        "models": [
+            {
+                "name": name,
+                "model": name,
+                "size": 4_661_224_676,
+                "digest": f"sim-{zlib.crc32(name.encode()):08x}",
+                "details": {"format": "gguf", "parameter_size": "8.0B"},
+            }
+            for name in config.models
+        ]
+    }
+
+
+@app.post("/api/generate")
+async def generate(request: GenerateRequest):  # type: ignore[no-untyped-def]
+    """Generate a completion with the configured latency profile."""
+    if request.model not in config.models:
+        return _error(f"model '{request.model}' not found", status=404)
+
+    started = time.perf_counter()
+    prompt_tokens = uncached_tokens((request.system or "") + request.prompt)
+    completion = complete(request.prompt)
+    tokens = _tokens(completion)
+    ttft, prompt_eval = _timings(prompt_tokens)
+    per_token = 1 / config.tokens_per_sec
+    fail = config.random.random() < config.error_rate
+
+    if not request.stream:
+        async with _slots:
+            await asyncio.sleep(ttft + prompt_eval)
+            if fail:
+                return _error("simulated model failure")
+            await asyncio.sleep(per_token * len(tokens))
+        body = _final(
+            request.model,
+            prompt_tokens,
+            len(tokens),
+            prompt_eval,
+            per_token * len(tokens),
+            started,
+        )
+        body["response"] = completion
+        return body
+
+    async def stream() -> AsyncIterator[bytes]:
+        async with _slots:
+            await asyncio.sleep(ttft + prompt_eval)
+            decode_start = time.perf_counter()
+            for token in tokens:
+                await asyncio.sleep(per_token)
+                chunk = {"model": request.model, "response": token, "done": False}
+                yield (json.dumps(chunk, ensure_ascii=False) + "\n").encode()
+            final = _final(
+                request.model,
+                prompt_tokens,
+                len(tokens),
+                prompt_eval,
+                time.perf_counter() - decode_start,
+                started,
+            )
+            final["response"] = ""
+            yield (json.dumps(final) + "\n").encode()
+
+    if fail:
+        # Ollama reports errors that happen before the first token as a 500
+        async with _slots:
+            await asyncio.sleep(ttft)
+        return _error("simulated model failure")
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
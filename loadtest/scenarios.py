@@ -0,0 +1,290 @@
+"""Mixed-workload load test for the API and LLM services.
+
+Drives an open-loop (Poisson) arrival stream so that latency includes the
+queueing a slow server causes, instead of the closed-loop "wait for the
+previous reply" pattern that hides it. Start the simulator and both
+services first, e.g.::
+
+    uvicorn loadtest.ollama_simulator:app --port 11434
+    (cd llm-repo && OLLAMA_URL=http://localhost:11434 uvicorn app.main:app --port 8001)
+    (cd api-repo && LLM_URL=http://localhost:11434 uvicorn app.main:app --port 8000)
+
+    python -m loadtest.scenarios --rate 100 --duration 120 --check
+
+The default mix is 30% create via LLM, 25% manual create, 30% list,
+5% export and 10% direct extraction on the LLM service; override it with
+``--mix llm_create=1,list=2``. ``--check`` exits with status 1 when the
+targets are missed: p95 of every scenario under ``--p95-target`` seconds,
+no failed requests, and successful throughput within 10% of the offered
+load (arrivals are random, so the offered rate itself varies around
+``--rate``).
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from typing import Awaitable, Callable, Dict, List, Optional
+
+import httpx
+
+NAMES = ["Maria Silva", "João Pereira", "Ana Souza", "Carlos Lima", "Fernanda Costa"]
+MOTIVOS = ["apoio emocional", "orientação jurídica", "apoio psicológico"]
+
+DEFAULT_MIX = {
+    "llm_create": 0.30,
+    "manual_create": 0.25,
+    "list": 0.30,
+    "export": 0.05,
+    "llm_extract": 0.10,
+}
+
+
+def _person(rng: random.Random) -> Dict[str, str]:
+    return {
+        "nome": rng.choice(NAMES),
+        "telefone": f"11-9{rng.randint(1000, 9999)}-{rng.randint(1000, 9999)}",
+        "motivo": rng.choice(MOTIVOS),
+    }
+
+
+def _free_text(rng: random.Random) -> str:
+    person = _person(rng)
+    email = person["nome"].split()[0].lower() + "@example.com"
+    return (
+        f"Bom dia, meu nome é {person['nome']}, telefone {person['telefone']}, "
+        f"email {email}. Preciso de {person['motivo']}, por favor retornem."
+    )
+
+
+class Target:
+    """Base URLs and shared HTTP client of the system under test."""
+
+    def __init__(self, api_url: str, llm_url: str, timeout: float):
+        self.api_url = api_url.rstrip("/")
+        self.llm_url = llm_url.rstrip("/")
+        self.client = httpx.AsyncClient(
+            timeout=timeout, limits=httpx.Limits(max_connections=None)
+        )
+
+
+Scenario = Callable[[Target, random.Random], Awaitable[httpx.Response]]
+
+
+async def llm_create(target: Target, rng: random.Random) -> httpx.Response:
+    """Create a contact from free text (API -> Ollama)."""
+    return await target.client.post(
+        f"{target.api_url}/api/v1/contatos/", json={"texto_livre": _free_text(rng)}
+    )
+
+
+async def manual_create(target: Target, rng: random.Random) -> httpx.Response:
+    """Create a contact from explicit fields."""
+    return await target.client.post(
+        f"{target.api_url}/api/v1/contatos/", json=_person(rng)
+    )
+
+
+async def list_contatos(target: Target, rng: random.Random) -> httpx.Response:
+    """List a page of contacts."""
+    skip = rng.choice([0, 0, 0, 50, 100])
+    return await target.client.get(
+        f"{target.api_url}/api/v1/contatos/", params={"skip": skip, "limit": 50}
+    )
+
+
+async def export(target: Target, rng: random.Random) -> httpx.Response:
+    """Export contacts to Excel."""
+    return await target.client.get(f"{target.api_url}/api/v1/contatos/export/excel")
+
+
+async def llm_extract(target: Target, rng: random.Random) -> httpx.Response:
+    """Extract entities directly on the LLM service."""
+    return await target.client.post(
+        f"{target.llm_url}/mcp/extract", json={"text": _free_text(rng)}
+    )
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    "llm_create": llm_create,
+    "manual_create": manual_create,
+    "list": list_contatos,
+    "export": export,
+    "llm_extract": llm_extract,
+}
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, round(q * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+class Recorder:
+    """Latencies and outcomes per scenario."""
+
+    def __init__(self) -> None:
+        self.latencies: Dict[str, List[float]] = {}
+        self.errors: Dict[str, Dict[str, int]] = {}
+
+    def record(self, name: str, latency: float, error: Optional[str]) -> None:
+        self.latencies.setdefault(name, []).append(latency)
+        if error:
+            errors = self.errors.setdefault(name, {})
+            errors[error] = errors.get(error, 0) + 1
+
+    def report(self, duration: float, elapsed: float) -> Dict:
+        scenarios = {}
+        total = failed = 0
+        for name, values in sorted(self.latencies.items()):
+            values.sort()
+            total += len(values)
+            failed += sum(self.errors.get(name, {}).values())
+            scenarios[name] = {
+                "count": len(values),
+                "errors": self.errors.get(name, {}),
+                "p50": percentile(values, 0.50),
+                "p95": percentile(values, 0.95),
+                "p99": percentile(values, 0.99),
+                "max": values[-1],
+            }
+        return {
+            "elapsed_s": elapsed,
+            "requests": total,
+            "offered_rpm": total / duration * 60,
+            "errors": failed,
+            # Only successful requests count towards throughput
+            "throughput_rpm": (total - failed) / elapsed * 60 if elapsed else 0.0,
+            "scenarios": scenarios,
+        }
+
+
+async def _one(
+    name: str, target: Target, rng: random.Random, recorder: Recorder
+) -> None:
+    start = time.perf_counter()
+    error = None
+    try:
+        response = await SCENARIOS[name](target, rng)
+        if response.status_code >= 400:
+            error = str(response.status_code)
+    except httpx.HTTPError as e:
+        error = type(e).__name__
+    recorder.record(name, time.perf_counter() - start, error)
+
+
+async def run(
+    target: Target,
+    mix: Dict[str, float],
+    rate_per_min: float,
+    duration: float,
+    max_in_flight: int,
+    seed: Optional[int] = None,
+) -> Dict:
+    """Issue requests for ``duration`` seconds and return the report."""
+    rng = random.Random(seed)
+    names = list(mix)
+    weights = [mix[n] for n in names]
+    recorder = Recorder()
+    in_flight = asyncio.Semaphore(max_in_flight)
+    tasks = []
+
+    async def bounded(name: str) -> None:
+        async with in_flight:
+            await _one(name, target, rng, recorder)
+
+    start = time.perf_counter()
+    next_at = start
+    while True:
+        next_at += rng.expovariate(rate_per_min / 60)
+        if next_at - start >= duration:
+            break
+        await asyncio.sleep(max(0.0, next_at - time.perf_counter()))
+        name = rng.choices(names, weights)[0]
+        tasks.append(asyncio.create_task(bounded(name)))
+
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - start
+    await target.client.aclose()
+    return recorder.report(duration, elapsed)
+
+
+def parse_mix(value: str) -> Dict[str, float]:
+    """Parse ``name=weight,...`` into a scenario mix."""
+    mix = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in SCENARIOS:
+            raise argparse.ArgumentTypeError(f"unknown scenario: {name}")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+def check(report: Dict, p95_target: float) -> List[str]:
+    """List the targets the run missed."""
+    failures = []
+    if report["errors"]:
+        failures.append(f"{report['errors']} of {report['requests']} requests failed")
+    for name, stats in report["scenarios"].items():
+        if stats["p95"] > p95_target:
+            failures.append(f"{name}: p95 {stats['p95']:.2f}s > {p95_target:.2f}s")
+    if report["throughput_rpm"] < report["offered_rpm"] * 0.9:
+        failures.append(
+            f"throughput {report['throughput_rpm']:.1f} rpm < "
+            f"offered {report['offered_rpm']:.1f} rpm"
+        )
+    return failures
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--api-url", default="http://localhost:8000")
+    parser.add_argument("--llm-url", default="http://localhost:8001")
+    parser.add_argument("--rate", type=float, default=100, help="requests/minute")
+    parser.add_argument("--duration", type=float, default=60, help="seconds")
+    parser.add_argument("--concurrency", type=int, default=64, help="max in flight")
+    parser.add_argument("--timeout", type=float, default=30)
+    parser.add_argument("--mix", type=parse_mix, default=DEFAULT_MIX)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--output", help="write the report JSON here")
+    parser.add_argument("--check", action="store_true", help="fail on missed targets")
+    parser.add_argument("--p95-target", type=float, default=3.0, help="seconds")
+    args = parser.parse_args(argv)
+
+    target = Target(args.api_url, args.llm_url, args.timeout)
+    report = asyncio.run(
+        run(target, args.mix, args.rate, args.duration, args.concurrency, args.seed)
+    )
+
+    print(  # noqa: T201
+        f"{report['requests']} requests ({report['errors']} failed) in "
+        f"{report['elapsed_s']:.1f}s, offered {report['offered_rpm']:.1f} req/min, "
+        f"{report['throughput_rpm']:.1f} ok req/min"
+    )
+    print(f"{'scenario':<16}{'n':>6}{'err':>6}{'p50':>9}{'p95':>9}{'p99':>9}")  # noqa: T201
+    for name, s in report["scenarios"].items():
+        print(  # noqa: T201
+            f"{name:<16}{s['count']:>6}{sum(s['errors'].values()):>6}"
+            f"{s['p50']:>9.3f}{s['p95']:>9.3f}{s['p99']:>9.3f}"
+        )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    if args.check:
+        failures = check(report, args.p95_target)
+        for line in failures:
+            print(f"MISSED {line}")  # noqa: T201
+        return 1 if failures else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())